@@ -2,6 +2,8 @@
 
 提供基础测试（pytest）的 API 接口
 """
+import asyncio
+
 from fastapi import APIRouter, Depends
 
 from llm_perf_platform.api.auth import get_current_user
@@ -20,7 +22,7 @@ task_service = TaskService()
 
 
 @router.post("/run", response_model=BasicTestResponse)
-def run_basic_test(request: BasicTestRequest, current_user: UserAccount = Depends(get_current_user)):
+async def run_basic_test(request: BasicTestRequest, current_user: UserAccount = Depends(get_current_user)):
     """运行基础测试（pytest）
 
     Args:
@@ -31,13 +33,11 @@ def run_basic_test(request: BasicTestRequest, current_user: UserAccount = Depend
     """
     # 构建参数字典
     parameters = request.model_dump()
-    ssh_config_dict = None
-    if request.ssh_config:
-        ssh_config_dict = request.ssh_config.model_dump()
-        parameters["ssh_config"] = ssh_config_dict
+    ssh_config_dict = parameters["ssh_config"]
 
     # 创建任务记录
-    record = task_service.create_task(
+    record = await asyncio.to_thread(
+        task_service.create_task,
         engine="pytest",
         model=f"{request.scenario}_basic_test",
         parameters=parameters,
@@ -51,17 +51,7 @@ def run_basic_test(request: BasicTestRequest, current_user: UserAccount = Depend
     payload = {
         "task_id": record.id,
         "task_type": TaskType.PYTEST.value,  # 修复：使用 task_type 而不是 command_type
-        "scenario": request.scenario,
-        "ssh_config": ssh_config_dict,
-        "testpaths": request.testpaths,
-        "case_level": request.case_level,
-        "model_priority": request.model_priority,
-        "lark_user": request.lark_user,
-        "topic": request.topic,
-        "notify_group": request.notify_group,
-        "report_server": request.report_server,
-        "report_url": request.report_url,
-        "pytest_args": request.pytest_args,
+        **parameters,
         "appauto_branch": request.appauto_branch if hasattr(request, 'appauto_branch') else "main",
     }
 
@@ -74,6 +74,9 @@ class BaseTestPerf(BaseModel):
 
     tp: Literal[1, 2, 4, 8] = 1
 
+    # 模型启动超时（秒），仅自动启动模型的场景使用；统一声明在基类，避免按类型探测字段
+    launch_timeout: int = Field(default=900, gt=0)
+
     # Appauto 版本配置
     appauto_branch: str = "main"  # Appauto 分支版本（如 main, v3.3.1）
 
@@ -95,7 +98,6 @@ class TestPerfViaFTWithLaunch(BaseTestPerf):
     base: Literal["ft"] = 'ft'
     skip_launch: bool = False
     tp: Literal[1, 2, 4, 8] = 1
-    launch_timeout: int = Field(default=900, gt=0)
 
 
 class TestRunResponse(BaseModel):
@@ -125,10 +127,12 @@ class TaskSummary(BaseModel):
 
 class TaskListResponse(BaseModel):
     items: List[TaskSummary]
-    total: int = 0
+    total: Optional[int] = 0  # 游标分页模式下不统计总数，返回 None
     page: int = 1
     page_size: int = 20
     total_pages: int = 0
+    next_cursor: Optional[str] = None  # 游标分页模式下的下一页游标
+    has_more: bool = False
 
 
 class TaskDetailResponse(TaskSummary):
@@ -352,6 +356,7 @@ class HardwareInfoCollectRequest(BaseModel):
     """硬件信息收集请求"""
     ssh_config: SSHConfig
     timeout: int = Field(default=300, description="执行超时时间（秒），默认 5 分钟")
+    force_refresh: bool = Field(default=False, description="忽略缓存的 CPU、内存条、系统版本等信息，全部重新采集")
 
 
 class HardwareInfoCollectResponse(BaseModel):
@@ -1,9 +1,11 @@
+import asyncio
+import re
 from pathlib import Path
-from typing import Any, Dict
-import math
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, status, Depends, Query
 from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 
 from llm_perf_platform.api.auth import get_current_user
 from llm_perf_platform.api.schemas import (
@@ -25,7 +27,7 @@ from llm_perf_platform.api.schemas import (
     TestPerfViaFTSkipLaunch,
     TestPerfViaFTWithLaunch,
 )
-from llm_perf_platform.executor.logger import LOG_DIR
+from llm_perf_platform.executor.logger import log_file_path
 from llm_perf_platform.models.db import get_session
 from llm_perf_platform.models.user_account import UserAccount
 from llm_perf_platform.services.task_service import TaskService
@@ -39,7 +41,7 @@ result_storage = ResultStorage()
 
 
 @router.post("/run", response_model=TestRunResponse)
-def run_test(request: TestRunRequest, current_user = Depends(get_current_user)):
+async def run_test(request: TestRunRequest, current_user = Depends(get_current_user)):
     # 验证远程执行模式下必须提供SSH配置
     if request.execution_mode == "remote" and not request.ssh_config:
         raise HTTPException(
@@ -48,12 +50,10 @@ def run_test(request: TestRunRequest, current_user = Depends(get_current_user)):
         )
 
     parameters = request.model_dump()
+    ssh_config_dict = parameters["ssh_config"]
 
-    ssh_config_dict = None
-    if request.ssh_config:
-        ssh_config_dict = request.ssh_config.model_dump()
-
-    record = task_service.create_task(
+    record = await asyncio.to_thread(
+        task_service.create_task,
         engine=request.engine,
         model=request.model,
         parameters=parameters,
@@ -63,33 +63,8 @@ def run_test(request: TestRunRequest, current_user = Depends(get_current_user)):
         appauto_branch=request.appauto_branch,
     )
 
-    payload = {
-        "task_id": record.id,
-        "engine": request.engine,
-        "model": request.model,
-        "input_length": request.input_length,
-        "output_length": request.output_length,
-        "concurrency": request.concurrency,
-        "loop": request.loop,
-        "warmup": request.warmup,
-        "execution_mode": request.execution_mode,
-        "scenario": request.scenario,
-        "ssh_config": ssh_config_dict,
-        "appauto_branch": request.appauto_branch,
-        # 模型启动配置
-        "auto_launch_model": request.auto_launch_model,
-        "model_config_name": request.model_config_name,
-        "model_path": request.model_path,
-        "model_tp": request.model_tp,
-        "model_mode": request.model_mode,
-        "model_port": request.model_port,
-        "model_host": request.model_host,
-        "stop_model_after_test": request.stop_model_after_test,
-        # AMaaS API 配置
-        "amaas_api_port": request.amaas_api_port,
-        "amaas_api_user": request.amaas_api_user,
-        "amaas_api_passwd": request.amaas_api_passwd,
-    }
+    # 请求的全部字段都需要传给调度器，直接复用 model_dump 的结果
+    payload = {"task_id": record.id, **parameters}
 
     task_scheduler.submit(record.id, payload)
 
@@ -100,62 +75,99 @@ def run_test(request: TestRunRequest, current_user = Depends(get_current_user)):
     )
 
 
-@router.post("/run_perf/amaas/skip_launch", response_model=TestRunResponse)
-def run_perf_via_amaas_skip_launch(request: TestPerfViaAMaaSSkipLaunch, current_user = Depends(get_current_user)):
-    """AMaaS 场景性能测试 - 跳过模型启动"""
-    return _run_perf_test(
-        base="amaas",
-        skip_launch=True,
-        request=request,
-        current_user=current_user,
-    )
+def _make_perf_handler(base: str, skip_launch: bool, request_model, summary: str):
+    """生成单个性能测试路由的处理函数"""
 
+    async def handler(request: request_model, current_user = Depends(get_current_user)):
+        return await _run_perf_test(
+            base=base,
+            skip_launch=skip_launch,
+            request=request,
+            current_user=current_user,
+        )
 
-@router.post("/run_perf/amaas/with_launch", response_model=TestRunResponse)
-def run_perf_via_amaas_with_launch(request: TestPerfViaAmaaSWithLaunch, current_user = Depends(get_current_user)):
-    """AMaaS 场景性能测试 - 自动启动模型"""
-    return _run_perf_test(
-        base="amaas",
-        skip_launch=False,
-        request=request,
-        current_user=current_user,
-    )
+    launch = "skip_launch" if skip_launch else "with_launch"
+    handler.__name__ = f"run_perf_via_{base}_{launch}"
+    handler.__doc__ = summary
+    return handler
 
 
-@router.post("/run_perf/ft/skip_launch", response_model=TestRunResponse)
-def run_perf_via_ft_skip_launch(request: TestPerfViaFTSkipLaunch, current_user = Depends(get_current_user)):
-    """FT 容器场景性能测试 - 跳过模型启动"""
-    return _run_perf_test(
-        base="ft",
-        skip_launch=True,
-        request=request,
-        current_user=current_user,
-    )
+def _make_perf_batch_handler(base: str, skip_launch: bool, request_model, summary: str):
+    """生成批量性能测试路由的处理函数"""
 
+    async def handler(requests: List[request_model], current_user = Depends(get_current_user)):
+        return await _run_perf_tests_batch(
+            base=base,
+            skip_launch=skip_launch,
+            requests=requests,
+            current_user=current_user,
+        )
+
+    launch = "skip_launch" if skip_launch else "with_launch"
+    handler.__name__ = f"run_perf_via_{base}_{launch}_batch"
+    handler.__doc__ = f"{summary}（批量提交）"
+    return handler
 
-@router.post("/run_perf/ft/with_launch", response_model=TestRunResponse)
-def run_perf_via_ft_with_launch(request: TestPerfViaFTWithLaunch, current_user = Depends(get_current_user)):
-    """FT 容器场景性能测试 - 自动启动模型"""
-    return _run_perf_test(
-        base="ft",
-        skip_launch=False,
-        request=request,
-        current_user=current_user,
+
+# 性能测试路由只在场景、是否跳过启动和请求模型上不同，统一由工厂函数生成
+_PERF_ROUTES = (
+    ("amaas", True, TestPerfViaAMaaSSkipLaunch, "AMaaS 场景性能测试 - 跳过模型启动"),
+    ("amaas", False, TestPerfViaAmaaSWithLaunch, "AMaaS 场景性能测试 - 自动启动模型"),
+    ("ft", True, TestPerfViaFTSkipLaunch, "FT 容器场景性能测试 - 跳过模型启动"),
+    ("ft", False, TestPerfViaFTWithLaunch, "FT 容器场景性能测试 - 自动启动模型"),
+)
+
+for _base, _skip_launch, _request_model, _summary in _PERF_ROUTES:
+    _path = f"/run_perf/{_base}/{'skip_launch' if _skip_launch else 'with_launch'}"
+    router.post(_path, response_model=TestRunResponse)(
+        _make_perf_handler(_base, _skip_launch, _request_model, _summary)
+    )
+    router.post(f"{_path}/batch", response_model=List[TestRunResponse])(
+        _make_perf_batch_handler(_base, _skip_launch, _request_model, _summary)
     )
 
+# 批量接口的请求列表通过预先构建的 TypeAdapter 一次性导出为字典，
+# 避免逐个调用 model_dump；适配器在导入时构建，之后所有请求共用
+_PERF_BATCH_ADAPTERS: Dict[Tuple[str, bool], TypeAdapter] = {
+    (_base, _skip_launch): TypeAdapter(List[_request_model])
+    for _base, _skip_launch, _request_model, _ in _PERF_ROUTES
+}
+
 
 @router.get("/list", response_model=TaskListResponse)
 def list_tasks(
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页大小"),
     task_type: str = Query(None, description="任务类型过滤 (hardware_info, perf_test, etc.)"),
+    cursor: Optional[str] = Query(None, description="游标分页：传入上一页的 next_cursor，首页传空字符串"),
     current_user = Depends(get_current_user)
 ):
     """获取任务列表（分页）
 
     默认每页返回20个任务，按创建时间倒序排列
     可以通过 task_type 参数过滤特定类型的任务
+
+    传入 cursor 参数时使用游标分页：不统计总数，通过 next_cursor / has_more 翻页；
+    否则使用页码分页，总数缓存 30 秒。
     """
+    if cursor is not None:
+        try:
+            tasks, next_cursor = task_service.list_tasks_by_cursor(
+                cursor=cursor or None,
+                page_size=page_size,
+                task_type=task_type,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+        return TaskListResponse(
+            items=[serialize_task(record, current_user.id) for record in tasks],
+            total=None,
+            page_size=page_size,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
+        )
+
     tasks, total = task_service.list_tasks_paginated(
         page=page,
         page_size=page_size,
@@ -163,14 +175,15 @@ def list_tasks(
     )
 
     items = [serialize_task(record, current_user.id) for record in tasks]
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    total_pages = -(-total // page_size)
 
     return TaskListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        has_more=page < total_pages,
     )
 
 
@@ -226,8 +239,16 @@ def download_result(task_id: int):
 
 
 @router.delete("/{task_id}", response_model=DeleteTaskResponse)
-def delete_task(task_id: int, current_user = Depends(get_current_user)):
-    record = task_service.get_task(task_id)
+async def delete_task(task_id: int, current_user = Depends(get_current_user)):
+    record = await asyncio.to_thread(
+        task_service.get_task_view,
+        task_id,
+        "user_id",
+        "result_path",
+        "archived_path",
+        "display_id",
+        "uuid",
+    )
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
@@ -238,15 +259,16 @@ def delete_task(task_id: int, current_user = Depends(get_current_user)):
             detail="You don't have permission to delete this task"
         )
 
-    task_service.delete_task(task_id)
-    result_storage.delete_file(record.result_path)
-    result_storage.delete_file(record.archived_path)
-
     # 删除日志文件 - 使用新的命名格式: {display_id}_{uuid}.log
-    display_id = record.display_id or task_id
-    log_file = LOG_DIR / f"{display_id}_{record.uuid}.log"
-    if log_file.exists():
-        log_file.unlink()
+    log_file = log_file_path(record.display_id or task_id, record.uuid)
+
+    # 先删除数据库记录：删除失败时文件仍然保留，记录不会指向已不存在的文件；三个文件的删除互不依赖，并发执行
+    await asyncio.to_thread(task_service.delete_task, task_id)
+    await asyncio.gather(
+        asyncio.to_thread(result_storage.delete_file, record.result_path),
+        asyncio.to_thread(result_storage.delete_file, record.archived_path),
+        asyncio.to_thread(result_storage.delete_file, str(log_file)),
+    )
     return DeleteTaskResponse(deleted=True)
 
 
@@ -257,24 +279,25 @@ def cancel_task(task_id: int, current_user = Depends(get_current_user)):
     只有任务创建者可以取消任务。
     只能取消状态为 queued 或 running 的任务。
     """
-    # 获取任务记录
-    record = task_service.get_task(task_id)
-    if not record:
+    # 只查询权限检查需要的字段
+    auth_view = task_service.get_auth_view(task_id)
+    if not auth_view:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    owner_id, task_status = auth_view
 
     # 检查权限：只有任务创建者可以取消
-    if record.user_id and record.user_id != current_user.id:
+    if owner_id and owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to cancel this task"
         )
 
     # 检查任务状态
-    if record.status not in ["queued", "running"]:
+    if task_status not in ["queued", "running"]:
         return CancelTaskResponse(
             task_id=task_id,
             cancelled=False,
-            message=f"Task cannot be cancelled. Current status: {record.status}"
+            message=f"Task cannot be cancelled. Current status: {task_status}"
         )
 
     # 尝试取消任务
@@ -297,14 +320,14 @@ def cancel_task(task_id: int, current_user = Depends(get_current_user)):
 
 
 @router.post("/{task_id}/retry", response_model=RetryTaskResponse)
-def retry_task(task_id: int, current_user = Depends(get_current_user)):
+async def retry_task(task_id: int, current_user = Depends(get_current_user)):
     """重新提交任务
 
     根据原任务的参数创建一个新任务并提交执行。
     适用于失败或需要重新运行的任务。
     """
     # 获取原任务记录
-    original_task = task_service.get_task(task_id)
+    original_task = await asyncio.to_thread(task_service.get_task, task_id)
     if not original_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -334,7 +357,8 @@ def retry_task(task_id: int, current_user = Depends(get_current_user)):
         # 不需要显式设置，调度器会使用默认值 perf_test_api
 
     # 创建新任务记录
-    new_record = task_service.create_task(
+    new_record = await asyncio.to_thread(
+        task_service.create_task,
         engine=original_task.engine,
         model=original_task.model,
         parameters=parameters,
@@ -345,17 +369,18 @@ def retry_task(task_id: int, current_user = Depends(get_current_user)):
 
     # 构建 payload 并提交到调度器
     payload = dict(parameters)
-    payload["task_id"] = new_record.id
+    new_task_id = new_record.id
+    payload["task_id"] = new_task_id
     payload["engine"] = original_task.engine
     payload["model"] = original_task.model
 
-    task_scheduler.submit(new_record.id, payload)
+    task_scheduler.submit(new_task_id, payload)
 
     return RetryTaskResponse(
         task_id=task_id,
-        new_task_id=new_record.id,
+        new_task_id=new_task_id,
         status="queued",
-        message=f"Task {task_id} has been resubmitted as task {new_record.id}"
+        message=f"Task {task_id} has been resubmitted as task {new_task_id}"
     )
 
 
@@ -375,8 +400,7 @@ def get_task_logs(task_id: int):
         )
 
     # 获取日志文件路径 - 使用新的命名格式: {display_id}_{uuid}.log
-    display_id = record.display_id or task_id
-    log_file = LOG_DIR / f"{display_id}_{record.uuid}.log"
+    log_file = log_file_path(record.display_id or task_id, record.uuid)
 
     if not log_file.exists():
         return TaskLogsResponse(
@@ -403,7 +427,7 @@ def get_task_logs(task_id: int):
 
 
 @router.post("/hardware_info/collect", response_model=HardwareInfoCollectResponse)
-def collect_hardware_info(request: HardwareInfoCollectRequest, current_user = Depends(get_current_user)):
+async def collect_hardware_info(request: HardwareInfoCollectRequest, current_user = Depends(get_current_user)):
     """收集远程机器的硬件信息
 
     收集包括：
@@ -420,12 +444,14 @@ def collect_hardware_info(request: HardwareInfoCollectRequest, current_user = De
     ssh_config = request.ssh_config.model_dump()
 
     # 创建任务记录
-    record = task_service.create_task(
+    record = await asyncio.to_thread(
+        task_service.create_task,
         engine="system",  # 使用 system 作为引擎标识
         model="hardware_info",  # 使用 hardware_info 作为模型名称
         parameters={
             "ssh_config": ssh_config,
             "timeout": request.timeout,
+            "force_refresh": request.force_refresh,
         },
         status="queued",
         ssh_config=ssh_config,
@@ -434,39 +460,82 @@ def collect_hardware_info(request: HardwareInfoCollectRequest, current_user = De
     )
 
     # 构建调度器 payload
+    task_id = record.id
     payload = {
-        "task_id": record.id,
+        "task_id": task_id,
         "task_type": "hardware_info",
         "ssh_config": ssh_config,
         "timeout": request.timeout,
+        "force_refresh": request.force_refresh,
     }
 
     # 提交任务到调度器
-    task_scheduler.submit(record.id, payload)
+    task_scheduler.submit(task_id, payload)
 
     return HardwareInfoCollectResponse(
-        task_id=record.id,
+        task_id=task_id,
         status=record.status,
-        message=f"Hardware info collection task {record.id} has been submitted"
+        message=f"Hardware info collection task {task_id} has been submitted"
     )
 
 
-def _run_perf_test(
+def _perf_common_fields(
+    fields: Dict[str, Any],
+    base: str,
+    skip_launch: bool,
+    model: str,
+    ssh_config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """构建性能测试任务参数与调度器 payload 的公共字段
+
+    Args:
+        fields: 请求对象导出的字段字典（会被原地修改）
+        base: 测试基础环境，"amaas" 或 "ft"
+        skip_launch: 是否跳过模型启动
+        model: 模型名称
+        ssh_config: SSH 配置
+
+    Returns:
+        Dict[str, Any]: 公共字段字典（含场景特定参数）
+    """
+    common = fields
+    common.update(
+        task_type="perf_test_cmd",  # 标记为命令行方式，重试时需要
+        base=base,
+        skip_launch=skip_launch,
+        model=model,
+        ssh_config=ssh_config,
+    )
+
+    # 根据场景添加特定参数
+    launch_timeout = common.pop("launch_timeout")
+    if not skip_launch:
+        if base == "amaas":
+            common["amaas_api_port"] = 10001
+            common["amaas_api_user"] = "admin"
+            common["amaas_api_passwd"] = "123456"
+        elif base == "ft":
+            common["launch_timeout"] = launch_timeout
+
+    return common
+
+
+def _prepare_perf_test(
     base: str,
     skip_launch: bool,
     request,
-    current_user,
-) -> TestRunResponse:
-    """性能测试的通用实现函数
+    fields: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+    """解析性能测试请求，构建公共字段
 
     Args:
         base: 测试基础环境，"amaas" 或 "ft"
         skip_launch: 是否跳过模型启动
         request: 请求对象（BaseTestPerf 子类）
-        current_user: 当前登录用户
+        fields: 已导出的请求字段（批量接口预先导出），为空时调用 model_dump
 
     Returns:
-        TestRunResponse: 测试任务响应
+        Tuple[Dict[str, Any], Dict[str, Any], int]: (公共字段, SSH 配置, 建议并发度)
     """
     # 构建 SSH 配置
     ssh_config = {
@@ -482,106 +551,115 @@ def _run_perf_test(
     parallel_list = [int(x.strip()) for x in request.parallel.split()]
 
     # 估算建议并发度（使用第一个并发值作为参考）
-    concurrency_details: Dict[str, Any] | None = None
     suggested_concurrency = parallel_list[0] if parallel_list else 1
 
     # 准备模型名称（如果没有提供，则留空等待验证）
     model = request.model or "unknown"
 
-    # 构建任务参数（包含所有 payload 需要的字段，确保重试时不丢失信息）
-    parameters = {
-        "task_type": "perf_test_cmd",  # 标记为命令行方式，重试时需要
-        "base": base,
-        "skip_launch": skip_launch,
-        "ip": request.ip,
-        "port": request.port,
-        "model": model,
-        "tokenizer_path": request.tokenizer_path,
+    # 任务参数与调度器 payload 共用的字段只构建一次
+    if fields is None:
+        fields = request.model_dump()
+    common = _perf_common_fields(fields, base, skip_launch, model, ssh_config)
+    return common, ssh_config, suggested_concurrency
+
+
+def _perf_task_spec(
+    common: Dict[str, Any],
+    ssh_config: Dict[str, Any],
+    suggested_concurrency: int,
+    user_id: int,
+) -> Dict[str, Any]:
+    """构建 create_task 所需的关键字参数"""
+    return {
+        "engine": "evalscope",  # 使用 evalscope 作为引擎
+        "model": common["model"],
+        # 任务参数包含所有 payload 需要的字段，确保重试时不丢失信息
+        "parameters": {**common, "concurrency": suggested_concurrency},
+        "status": "queued",
         "ssh_config": ssh_config,
-        "ssh_user": request.ssh_user,
-        "ssh_password": request.ssh_password,
-        "ssh_port": request.ssh_port,
-        "parallel": request.parallel,
-        "number": request.number,
-        "input_length": request.input_length,
-        "output_length": request.output_length,
-        "loop": request.loop,
-        "debug": request.debug,
-        "warmup": request.warmup,
-        "keep_model": request.keep_model,
-        "concurrency": suggested_concurrency,
-        "tp": request.tp,
-        "appauto_branch": request.appauto_branch,
+        "user_id": user_id,
+        "appauto_branch": common["appauto_branch"],
     }
 
-    # 根据场景添加特定参数
-    if not skip_launch:
-        if base == "amaas":
-            parameters["amaas_api_port"] = 10001
-            parameters["amaas_api_user"] = "admin"
-            parameters["amaas_api_passwd"] = "123456"
-        elif base == "ft":
-            parameters["launch_timeout"] = getattr(request, "launch_timeout", 900)
 
-    # 创建任务记录
-    record = task_service.create_task(
-        engine="evalscope",  # 使用 evalscope 作为引擎
-        model=model,
-        parameters=parameters,
-        status="queued",
-        ssh_config=ssh_config,
-        user_id=current_user.id,
-        appauto_branch=request.appauto_branch,
-    )
+async def _run_perf_test(
+    base: str,
+    skip_launch: bool,
+    request,
+    current_user,
+) -> TestRunResponse:
+    """性能测试的通用实现函数
 
-    # 构建调度器 payload
-    payload = {
-        "task_id": record.id,
-        "task_type": "perf_test_cmd",  # 使用命令行方式
-        "base": base,
-        "skip_launch": skip_launch,
-        "ip": request.ip,
-        "port": request.port,
-        "model": model,
-        "tokenizer_path": request.tokenizer_path,
-        "ssh_user": request.ssh_user,
-        "ssh_password": request.ssh_password,
-        "ssh_port": request.ssh_port,
-        "parallel": request.parallel,
-        "number": request.number,
-        "input_length": request.input_length,
-        "output_length": request.output_length,
-        "loop": request.loop,
-        "debug": request.debug,
-        "warmup": request.warmup,
-        "keep_model": request.keep_model,
-        "ssh_config": ssh_config,
-        "tp": request.tp,
-        "appauto_branch": request.appauto_branch,
-    }
+    Args:
+        base: 测试基础环境，"amaas" 或 "ft"
+        skip_launch: 是否跳过模型启动
+        request: 请求对象（BaseTestPerf 子类）
+        current_user: 当前登录用户
 
-    # 添加场景特定参数
-    if not skip_launch:
-        if base == "amaas":
-            payload["amaas_api_port"] = 10001
-            payload["amaas_api_user"] = "admin"
-            payload["amaas_api_passwd"] = "123456"
-        elif base == "ft":
-            payload["tp"] = getattr(request, "tp", 1)
-            payload["launch_timeout"] = getattr(request, "launch_timeout", 900)
+    Returns:
+        TestRunResponse: 测试任务响应
+    """
+    common, ssh_config, suggested_concurrency = _prepare_perf_test(base, skip_launch, request)
 
-    # 提交任务到调度器
-    task_scheduler.submit(record.id, payload)
+    # 创建任务记录
+    record = await asyncio.to_thread(
+        task_service.create_task,
+        **_perf_task_spec(common, ssh_config, suggested_concurrency, current_user.id),
+    )
+
+    # 构建调度器 payload 并提交
+    task_scheduler.submit(record.id, {"task_id": record.id, **common})
 
     return TestRunResponse(
         task_id=record.id,
         status=record.status,
         concurrency=suggested_concurrency,
-        auto_concurrency=False,
-        concurrency_details=concurrency_details,
     )
 
 
+async def _run_perf_tests_batch(
+    base: str,
+    skip_launch: bool,
+    requests: List[Any],
+    current_user,
+) -> List[TestRunResponse]:
+    """批量性能测试：一次事务创建全部任务记录，一次性提交到调度器
+
+    Args:
+        base: 测试基础环境，"amaas" 或 "ft"
+        skip_launch: 是否跳过模型启动
+        requests: 请求对象列表（BaseTestPerf 子类）
+        current_user: 当前登录用户
+
+    Returns:
+        List[TestRunResponse]: 与请求顺序一致的任务响应列表
+    """
+    dumped = _PERF_BATCH_ADAPTERS[(base, skip_launch)].dump_python(requests)
+    prepared = [
+        _prepare_perf_test(base, skip_launch, request, fields)
+        for request, fields in zip(requests, dumped)
+    ]
+
+    records = await asyncio.to_thread(task_service.create_tasks, [
+        _perf_task_spec(common, ssh_config, suggested_concurrency, current_user.id)
+        for common, ssh_config, suggested_concurrency in prepared
+    ])
+
+    task_scheduler.submit_many(
+        (record.id, {"task_id": record.id, **common})
+        for record, (common, _, _) in zip(records, prepared)
+    )
+
+    return [
+        TestRunResponse(
+            task_id=record.id,
+            status=record.status,
+            concurrency=suggested_concurrency,
+        )
+        for record, (_, _, suggested_concurrency) in zip(records, prepared)
+    ]
+
+
 def serialize_task(record, current_user_id: int = None) -> TaskSummary:
     user_email = None
     if record.user_id:
@@ -590,7 +668,9 @@ def serialize_task(record, current_user_id: int = None) -> TaskSummary:
             if user:
                 user_email = user.email
 
-    return TaskSummary(
+    # 字段均来自数据库记录（可信且类型已确定），跳过构造时的重复校验；
+    # FastAPI 按 response_model 输出时仍会做一次校验
+    return TaskSummary.model_construct(
         id=record.id,
         uuid=record.uuid,
         display_id=record.display_id,
@@ -610,6 +690,11 @@ def serialize_task(record, current_user_id: int = None) -> TaskSummary:
     )
 
 
+# `git branch -a` 的一行：两字符前缀（"* " 当前分支、"+ " 其他工作树、"  "），
+# 远程分支去掉 remotes/origin/ 前缀；含空格的行（HEAD 指针、detached 状态）不匹配
+_BRANCH_PATTERN = re.compile(r"^[*+ ] (?:remotes/origin/)?(?P<branch>\S+)$", re.MULTILINE)
+
+
 @router.get("/appauto/branches")
 def get_appauto_branches(current_user: UserAccount = Depends(get_current_user)) -> Dict[str, Any]:
     """获取可用的 appauto 分支列表
@@ -644,33 +729,10 @@ def get_appauto_branches(current_user: UserAccount = Depends(get_current_user))
                 detail=f"Failed to get branches: {result.stderr}"
             )
 
-        # 解析分支列表
-        branches = []
-        for line in result.stdout.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            # 移除当前分支标记 *
-            if line.startswith("* "):
-                line = line[2:]
-
-            # 跳过 HEAD 指针
-            if "HEAD ->" in line:
-                continue
-
-            # 处理远程分支
-            if line.startswith("remotes/origin/"):
-                branch = line.replace("remotes/origin/", "")
-                if branch not in branches:
-                    branches.append(branch)
-            else:
-                # 本地分支
-                if line not in branches:
-                    branches.append(line)
-
-        # 排序并将 main 放在最前面
-        branches.sort()
+        # 解析分支列表：一次正则扫描整个输出，本地与远程同名分支去重
+        branches = sorted({match.group("branch") for match in _BRANCH_PATTERN.finditer(result.stdout)})
+
+        # 将 main 放在最前面
         if "main" in branches:
             branches.remove("main")
             branches.insert(0, "main")
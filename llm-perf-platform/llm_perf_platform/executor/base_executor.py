@@ -4,9 +4,12 @@
 - Python API 方式（TestExecutor）
 - 命令行方式（CommandExecutor）
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, ClassVar, Dict, Any, Optional, Sequence, TypeVar
 from enum import Enum
+from weakref import WeakValueDictionary
 
 from llm_perf_platform.executor.logger import TaskLogger
 from llm_perf_platform.services.task_service import TaskService
@@ -34,70 +37,107 @@ class TaskType(str, Enum):
     GENERIC_COMMAND = "generic_command"  # 通用的 appauto 命令
 
 
+# 字符串值 -> 枚举成员的映射，导入时构建一次；分发时用字典查找代替 TaskType(value) 的构造与异常
+TASK_TYPES_BY_VALUE: Dict[str, TaskType] = {t.value: t for t in TaskType}
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """统一的执行结果格式"""
 
-    def __init__(
-        self,
-        success: bool,
-        summary: Dict[str, Any],
-        error: Optional[str] = None,
-        requests: Optional[list] = None,
-        output_file: Optional[str] = None,
-        stdout: Optional[str] = None,
-        stderr: Optional[str] = None,
-        exit_code: Optional[int] = None,
-    ):
-        self.success = success
-        self.summary = summary
-        self.error = error
-        self.requests = requests or []
-        self.output_file = output_file
-        self.stdout = stdout
-        self.stderr = stderr
-        self.exit_code = exit_code
+    success: bool
+    summary: Dict[str, Any]
+    error: Optional[str] = None
+    # 默认共享不可变的空元组，不为每个结果创建空列表
+    requests: Sequence[Any] = ()
+    output_file: Optional[str] = None
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+    exit_code: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # 兼容显式传入 requests=None 的调用方
+        if self.requests is None:
+            self.requests = ()
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式"""
-        result = {
+        """转换为字典格式
+
+        可选字段为 None 或空字符串时省略（exit_code=0 保留）
+        """
+        optional = (
+            ("error", self.error),
+            ("output_file", self.output_file),
+            ("stdout", self.stdout),
+            ("stderr", self.stderr),
+            ("exit_code", self.exit_code),
+        )
+        return {
             "success": self.success,
             "summary": self.summary,
             "requests": self.requests,
+            **{key: value for key, value in optional if value is not None and value != ""},
         }
-        if self.error:
-            result["error"] = self.error
-        if self.output_file:
-            result["output_file"] = self.output_file
-        if self.stdout:
-            result["stdout"] = self.stdout
-        if self.stderr:
-            result["stderr"] = self.stderr
-        if self.exit_code is not None:
-            result["exit_code"] = self.exit_code
-        return result
-
-
-class BaseExecutor(ABC):
-    """执行器抽象基类
+
+
+_T = TypeVar("_T")
+
+# 每个工作线程复用一个事件循环（线程存活期间不关闭）
+_thread_state = threading.local()
+
+
+def run_sync(coro: Awaitable[_T]) -> _T:
+    """在当前线程的常驻事件循环中运行协程直到完成
+
+    调度器的工作线程是长期存在的，复用同一个事件循环可以省去每个任务创建/关闭
+    事件循环（selector、自唤醒 socketpair）的开销；子进程 transport 也不会在
+    事件循环关闭后才被回收。
+    """
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _thread_state.loop = loop
+    return loop.run_until_complete(coro)
+
+
+# task_id -> TaskLogger；执行器实例释放后对应的 logger 自动回收
+_LOGGER_CACHE: "WeakValueDictionary[int, TaskLogger]" = WeakValueDictionary()
+
+
+class BaseExecutor:
+    """执行器基类
 
     所有执行器必须实现 execute 方法，返回统一的 ExecutionResult
+    （不使用 ABCMeta，避免每次实例化时的抽象方法检查）
     """
 
+    # TaskService 无状态（每次调用独立开启 session），所有执行器共享一个实例
+    _task_service: ClassVar[TaskService] = TaskService()
+
     def __init__(self, task_id: int):
         self.task_id = task_id
 
-        # Fetch task record to get UUID and display_id for logger
-        task_service = TaskService()
-        task = task_service.get_task(task_id)
-        if task:
-            self.logger = TaskLogger(task.uuid, task.display_id or task_id)
-        else:
-            # Fallback: if task not found, use task_id for both
-            # This shouldn't happen in normal operation
-            import uuid
-            self.logger = TaskLogger(str(uuid.uuid4()), task_id)
-
-    @abstractmethod
+        # 同一任务的多个执行器共享一个 TaskLogger：避免重复查库，
+        # 也避免 TaskLogger 初始化时清空前一个执行器已写入的日志
+        logger = _LOGGER_CACHE.get(task_id)
+        if logger is None:
+            # Fetch task record to get UUID and display_id for logger
+            task = self._task_service.get_task_view(task_id, "uuid", "display_id")
+            if task:
+                logger = TaskLogger(task.uuid, task.display_id or task_id)
+            else:
+                # Fallback: if task not found, derive a stable tag from task_id
+                # This shouldn't happen in normal operation
+                logger = TaskLogger(f"task-{task_id}", task_id)
+            _LOGGER_CACHE[task_id] = logger
+        self.logger = logger
+
+        # 直接绑定到 logger 的方法，省去一层包装调用
+        self.log_info = self.logger.info
+        self.log_error = self.logger.error
+        self.log_debug = self.logger.debug
+
     async def execute(self, payload: Dict[str, Any]) -> ExecutionResult:
         """执行任务
 
@@ -107,16 +147,4 @@ class BaseExecutor(ABC):
         Returns:
             ExecutionResult: 统一的执行结果
         """
-        pass
-
-    def log_info(self, message: str) -> None:
-        """记录信息日志"""
-        self.logger.info(message)
-
-    def log_error(self, message: str) -> None:
-        """记录错误日志"""
-        self.logger.error(message)
-
-    def log_debug(self, message: str) -> None:
-        """记录调试日志"""
-        self.logger.debug(message)
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
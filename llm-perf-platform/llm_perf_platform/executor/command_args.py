@@ -0,0 +1,86 @@
+"""appauto 命令行参数表
+
+参数表与构建函数只依赖内置类型，不引用执行器的其他部分，
+可以单独用 mypyc 等工具编译；未编译时即为普通 Python 模块。
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Tuple
+
+# 命令行参数表：(payload 字段, 命令行选项, 是否为开关选项)
+# 字段值为真时追加参数；开关选项只追加选项本身，其余追加 "选项 值"
+ArgSpec = Tuple[str, str, bool]
+
+PERF_CONNECTION_ARGS: Tuple[ArgSpec, ...] = (
+    ("ip", "--ip", False),
+    ("port", "--port", False),
+    # SSH 参数
+    ("ssh_user", "--ssh-user", False),
+    ("ssh_password", "--ssh-password", False),
+    ("ssh_port", "--ssh-port", False),
+    # 测试参数
+    ("parallel", "--parallel", False),
+    ("number", "--number", False),
+    # 模型参数
+    ("model", "--model", False),
+)
+# 不跳过模型启动时才需要的参数
+PERF_LAUNCH_ARGS: Tuple[ArgSpec, ...] = (
+    ("tp", "--tp", False),
+    ("launch_timeout", "--launch-timeout", False),
+)
+PERF_OPTIONAL_ARGS: Tuple[ArgSpec, ...] = (
+    ("tokenizer_path", "--tokenizer-path", False),
+    ("input_length", "--input-length", False),
+    ("output_length", "--output-length", False),
+    ("loop", "--loop", False),
+    ("debug", "--debug", True),
+    ("keep_model", "--keep-model", True),
+)
+# 性能测试完整参数表：按是否跳过模型启动预先拼接，构建时只需遍历一次
+PERF_SKIP_LAUNCH_ARGS: Tuple[ArgSpec, ...] = PERF_CONNECTION_ARGS + PERF_OPTIONAL_ARGS
+PERF_WITH_LAUNCH_ARGS: Tuple[ArgSpec, ...] = (
+    PERF_CONNECTION_ARGS + PERF_LAUNCH_ARGS + PERF_OPTIONAL_ARGS
+)
+# (是否 amaas 场景, 是否跳过模型启动) -> (固定选项, 参数表)
+PERF_MODES: Dict[Tuple[bool, bool], Tuple[Tuple[str, ...], Tuple[ArgSpec, ...]]] = {
+    (True, True): (("--base-amaas", "--skip-launch"), PERF_SKIP_LAUNCH_ARGS),
+    (True, False): (("--base-amaas",), PERF_WITH_LAUNCH_ARGS),
+    (False, True): (("--base-ft", "--skip-launch"), PERF_SKIP_LAUNCH_ARGS),
+    (False, False): (("--base-ft",), PERF_WITH_LAUNCH_ARGS),
+}
+
+PYTEST_NOTIFY_ARGS: Tuple[ArgSpec, ...] = (
+    ("lark_user", "--lark-user", False),
+    ("topic", "--topic", False),
+)
+PYTEST_HOST_ARGS: Tuple[ArgSpec, ...] = (("host", "--ip", False),)  # 取自 ssh_config
+PYTEST_LEVEL_ARGS: Tuple[ArgSpec, ...] = (
+    ("case_level", "--case-level", False),
+    ("model_priority", "--model_priority", False),
+)
+PYTEST_SSH_ARGS: Tuple[ArgSpec, ...] = (  # 取自 ssh_config
+    ("user", "--ssh_user", False),
+    ("port", "--ssh_port", False),
+)
+PYTEST_REPORT_ARGS: Tuple[ArgSpec, ...] = (
+    ("notify_group", "--notify-group", False),
+    ("report_server", "--report-server", False),
+    ("report_url", "--report-url", False),
+)
+
+ENV_DEPLOY_ARGS: Tuple[ArgSpec, ...] = (("deploy_config", "--config", False),)
+
+
+def extend_args(
+    args: List[str], source: Mapping[str, object], specs: Tuple[ArgSpec, ...]
+) -> None:
+    """按参数表把命令行参数直接追加到已有列表，不产生中间列表"""
+    append = args.append
+    for key, flag, is_switch in specs:
+        value = source.get(key)
+        if not value:
+            continue
+        append(flag)
+        if not is_switch:
+            append(str(value))
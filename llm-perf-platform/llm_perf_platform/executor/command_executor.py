@@ -8,15 +8,308 @@
 """
 import asyncio
 import json
+import os
+import re
 import shlex
+import shutil
+import signal
+import stat
+import sys
+import threading
+from functools import lru_cache, partial
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Deque, Dict, Any, FrozenSet, Optional, List, Tuple
 
 from llm_perf_platform.executor.base_executor import (
     BaseExecutor,
     ExecutionResult,
+    TASK_TYPES_BY_VALUE,
     TaskType,
 )
+from llm_perf_platform.executor.command_args import (
+    ENV_DEPLOY_ARGS,
+    PERF_MODES,
+    PYTEST_HOST_ARGS,
+    PYTEST_LEVEL_ARGS,
+    PYTEST_NOTIFY_ARGS,
+    PYTEST_REPORT_ARGS,
+    PYTEST_SSH_ARGS,
+    extend_args,
+)
+
+# appauto 输出结果文件的提示行，如 "The performance test data has been saved to: xxx.csv, xxx.xlsx"
+# 每行只关心两种内容：整行 JSON 或包含 "saved to:" 提示；命中提示后再扫描出 xlsx/csv 文件名。
+# 直接在原始字节上匹配，只解码命中的内容
+_SAVED_TO_MARKER = b"saved to:"
+_OUTPUT_FILE_PATTERN = re.compile(rb'[a-f0-9\-]+_\d{8}_\d{6}\.(xlsx|csv)')
+# _OUTPUT_FILE_PATTERN 可匹配的扩展名数量；提示行中两种文件都找到后不再继续扫描
+_OUTPUT_FILE_EXT_COUNT = 2
+
+# 命令输出只保留开头和末尾若干行用于日志和执行结果，避免长时间任务的输出无限占用内存；
+# 同时按字节数限制，防止少量超长行占用过多内存
+OUTPUT_HEAD_LINES = 200
+OUTPUT_TAIL_LINES = 2000
+OUTPUT_HEAD_BYTES = 256 * 1024
+OUTPUT_TAIL_BYTES = 256 * 1024
+# 未解析到结构化信息时 raw_output 保留的 stdout 前缀长度
+RAW_OUTPUT_CHARS = 1000
+# 单行读取上限，超长行会被丢弃
+STREAM_LIMIT = 1024 * 1024
+# 写入任务日志的输出上限（字节），只记录末尾部分
+MAX_LOG_BYTES = 64 * 1024
+# 命令被 cancel() 中止时的错误信息
+CANCELLED_ERROR = "Command cancelled"
+
+_HAS_TASK_GROUP = sys.version_info >= (3, 11)
+# Linux 5.4+ 可通过 pidfd + waitid(P_PIDFD) 确认 PID 仍对应本进程尚未回收的子进程
+_HAS_PIDFD = hasattr(os, "pidfd_open") and hasattr(os, "P_PIDFD")
+
+
+def _parse_cpu_list(spec: str) -> FrozenSet[int]:
+    """解析 "2-7,9" 格式的 CPU 列表，格式错误时返回空集合"""
+    cpus = set()
+    try:
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            start, _, end = part.partition("-")
+            cpus.update(range(int(start), int(end or start) + 1))
+    except ValueError:
+        return frozenset()
+    return frozenset(cpus)
+
+
+# 性能测试子进程绑定的 CPU 列表（如 "2-7"），使其与运行事件循环的 CPU 隔开，
+# 结果汇总等 CPU 密集阶段不会干扰输出读取；未设置、平台不支持或 CPU 少于 4 个时不绑定
+PERF_CHILD_CPUS: FrozenSet[int] = (
+    _parse_cpu_list(os.getenv("LLM_PERF_CHILD_CPUS", ""))
+    if hasattr(os, "sched_setaffinity") and (os.cpu_count() or 0) >= 4
+    else frozenset()
+)
+
+
+@lru_cache(maxsize=32)
+def _command_prefixes(appauto_path: str) -> Dict[TaskType, Tuple[str, ...]]:
+    """各命令类型的固定命令前缀（按 appauto 路径缓存，多个执行器共享）"""
+    return {
+        TaskType.PERF_TEST_CMD: (appauto_path, "bench", "evalscope", "perf"),
+        TaskType.PYTEST: (appauto_path, "run", "pytest"),
+        TaskType.ENV_DEPLOY: (appauto_path, "env", "deploy"),
+    }
+
+
+class OutputBuffer:
+    """有界的输出缓冲区：保留开头和末尾若干行
+
+    开头最多 OUTPUT_HEAD_LINES 行 / OUTPUT_HEAD_BYTES 字节，
+    末尾最多 OUTPUT_TAIL_LINES 行 / OUTPUT_TAIL_BYTES 字节（至少保留最后一行）。
+    """
+
+    __slots__ = ("head", "tail", "total", "_head_bytes", "_tail_bytes")
+
+    def __init__(self) -> None:
+        self.head: List[bytes] = []
+        self.tail: Deque[bytes] = deque()
+        self.total = 0
+        self._head_bytes = 0
+        self._tail_bytes = 0
+
+    def append(self, line: bytes) -> None:
+        self.total += 1
+        size = len(line)
+        tail = self.tail
+        # 开头部分一旦写满就不再追加，保证行的先后顺序
+        if (
+            not tail
+            and len(self.head) < OUTPUT_HEAD_LINES
+            and self._head_bytes + size <= OUTPUT_HEAD_BYTES
+        ):
+            self.head.append(line)
+            self._head_bytes += size
+            return
+
+        tail.append(line)
+        self._tail_bytes += size
+        while len(tail) > OUTPUT_TAIL_LINES or (
+            self._tail_bytes > OUTPUT_TAIL_BYTES and len(tail) > 1
+        ):
+            self._tail_bytes -= len(tail.popleft())
+
+    @property
+    def dropped(self) -> int:
+        """中间被丢弃的行数"""
+        return self.total - len(self.head) - len(self.tail)
+
+    def getvalue(self) -> bytes:
+        head = b"".join(self.head)
+        if self.dropped:
+            head += b"\n...[truncated %d lines]...\n" % self.dropped
+        return head + b"".join(self.tail)
+
+
+async def drain_stream(
+    stream: asyncio.StreamReader,
+    buffer: OutputBuffer,
+    on_line: Optional[Callable[[bytes], None]] = None,
+) -> None:
+    """逐行读取输出流，写入有界缓冲区并回调解析
+
+    Args:
+        stream: 子进程的 stdout/stderr
+        buffer: 保存开头和末尾若干行的缓冲区
+        on_line: 每行的处理回调
+    """
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # 单行超过 STREAM_LIMIT，超出部分已被丢弃，继续读取后续内容
+            buffer.append(b"...(line truncated)\n")
+            continue
+        if not line:
+            break
+        buffer.append(line)
+        if on_line is not None:
+            on_line(line)
+
+
+async def wait_process(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+    stdout_buffer: OutputBuffer,
+    stderr_buffer: OutputBuffer,
+    on_stdout: Optional[Callable[[bytes], None]] = None,
+) -> None:
+    """读取两个输出流直到子进程退出，超过 timeout 秒抛出 asyncio.TimeoutError
+
+    Python 3.11+ 使用 asyncio.timeout + TaskGroup（单个定时回调，取消会传递给读取任务）；
+    3.10 回退到 wait_for + gather。超时后由调用方结束子进程，缓冲区中保留已读取的输出。
+    """
+    if _HAS_TASK_GROUP:
+        async with asyncio.timeout(timeout):
+            async with asyncio.TaskGroup() as group:
+                group.create_task(drain_stream(process.stdout, stdout_buffer, on_stdout))
+                group.create_task(drain_stream(process.stderr, stderr_buffer))
+                await process.wait()
+    else:
+        await asyncio.wait_for(
+            asyncio.gather(
+                drain_stream(process.stdout, stdout_buffer, on_stdout),
+                drain_stream(process.stderr, stderr_buffer),
+                process.wait(),
+            ),
+            timeout=timeout,
+        )
+
+
+def _is_unreaped_child(pidfd: int) -> bool:
+    """pidfd 引用的进程是否仍是本进程尚未回收的子进程（WNOWAIT：只查询，不回收）
+
+    子进程被回收后 waitid 返回 ECHILD；PID 被复用时 pidfd 指向的也不是本进程的子进程。
+    """
+    try:
+        os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except ChildProcessError:
+        return False
+    return True
+
+
+def _kill_group(process: asyncio.subprocess.Process, pidfd: Optional[int]) -> None:
+    """向子进程所在的整个进程组发送 SIGKILL，连同 appauto 派生的 evalscope 等进程一起结束
+
+    子进程以 start_new_session 启动，进程组 ID 即其 PID。只有确认该进程尚未被回收
+    （有 pidfd 时由 waitid 确认，否则依据 returncode）才发送：此时该 PID 不会被复用，
+    进程组一定是本任务的。
+    """
+    if pidfd is not None:
+        if not _is_unreaped_child(pidfd):
+            return
+    elif process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # 进程组已全部退出
+
+
+class _LazyCommand:
+    """日志参数：写入日志时才拼接并转义命令行"""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: List[str]) -> None:
+        self.parts = parts
+
+    def __str__(self) -> str:
+        return shlex.join(self.parts)
+
+
+class _LazyOutput:
+    """日志参数：写入日志时才截取并解码输出末尾 MAX_LOG_BYTES 字节"""
+
+    __slots__ = ("output",)
+
+    def __init__(self, output: bytes) -> None:
+        self.output = output
+
+    def __str__(self) -> str:
+        if len(self.output) <= MAX_LOG_BYTES:
+            return self.output.decode("utf-8", errors="replace")
+        return "...(truncated)\n" + self.output[-MAX_LOG_BYTES:].decode("utf-8", errors="replace")
+
+
+# (项目根目录, 工作目录) -> venv 中的 appauto 路径；venv 布局在进程生命周期内不变，查找一次即可
+_VENV_APPAUTO_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
+
+
+@lru_cache(maxsize=256)
+def _split_args(args: str) -> Tuple[str, ...]:
+    """按 shell 规则拆分参数字符串；相同字符串（如重复提交的 pytest 参数）只解析一次"""
+    return tuple(shlex.split(args))
+
+
+def normalize_command(command: Any) -> List[str]:
+    """将命令统一为参数列表：字符串按 shell 规则拆分一次，列表原样复制"""
+    if not command:
+        return []
+    if isinstance(command, str):
+        return list(_split_args(command))
+    return [str(part) for part in command]
+
+
+@lru_cache(maxsize=32)
+def _which(command: str, path_env: Optional[str]) -> Optional[str]:
+    """在 PATH 中查找可执行文件（按 PATH 取值缓存）"""
+    return shutil.which(command, path=path_env)
+
+
+def _resolve_executable(command: str) -> str:
+    """将裸命令名解析为绝对路径
+
+    可执行文件路径包含目录分隔符时，create_subprocess_exec 可以走 posix_spawn
+    快速路径，无需在子进程中遍历 PATH；找不到时原样返回。
+    """
+    if os.sep in command:
+        return command
+    return _which(command, os.environ.get("PATH")) or command
+
+
+@lru_cache(maxsize=32)
+def _venv_environ(executable: str, path_env: Optional[str]) -> Optional[Dict[str, str]]:
+    """可执行文件位于虚拟环境 bin 目录时，构造等同于 source activate 后的环境变量
+
+    按 (可执行文件, PATH) 缓存，多个执行器共享同一个字典（只读，不要修改）。
+    不在虚拟环境中时返回 None，子进程直接继承当前环境。
+    """
+    bin_dir = os.path.dirname(executable)
+    venv_dir = os.path.dirname(bin_dir)
+    if not bin_dir or not os.path.isfile(os.path.join(venv_dir, "pyvenv.cfg")):
+        return None
+
+    env = dict(os.environ)
+    env.pop("PYTHONHOME", None)
+    env["VIRTUAL_ENV"] = venv_dir
+    env["PATH"] = bin_dir + os.pathsep + path_env if path_env else bin_dir
+    return env
 
 
 class CommandExecutor(BaseExecutor):
@@ -37,7 +330,8 @@ class CommandExecutor(BaseExecutor):
         timeout: int = 3600,
     ):
         super().__init__(task_id)
-        self.command_type = command_type
+        # 构造时统一为枚举成员，execute 未指定 command_type 时可直接使用
+        self.command_type = TaskType(command_type)
 
         # 自动检测并使用 venv 中的 appauto
         if appauto_path == "appauto":
@@ -46,13 +340,76 @@ class CommandExecutor(BaseExecutor):
                 self.appauto_path = venv_appauto
                 self.log_info(f"Using venv appauto: {venv_appauto}")
             else:
-                self.appauto_path = appauto_path
-                self.log_info(f"Venv appauto not found, using system appauto: {appauto_path}")
+                self.appauto_path = _resolve_executable(appauto_path)
+                self.log_info(f"Venv appauto not found, using system appauto: {self.appauto_path}")
         else:
-            self.appauto_path = appauto_path
-            self.log_info(f"Using specified appauto: {appauto_path}")
+            self.appauto_path = _resolve_executable(appauto_path)
+            self.log_info(f"Using specified appauto: {self.appauto_path}")
 
         self.timeout = timeout
+        self._prefixes = _command_prefixes(self.appauto_path)
+        # appauto 在虚拟环境中时预先构造激活后的环境，子进程中调用的 python 等命令也使用该环境
+        self._env = _venv_environ(self.appauto_path, os.environ.get("PATH"))
+
+        # 运行中的子进程 -> (pidfd, 取消通知)，供其他线程调用 cancel() 终止
+        self._lock = threading.Lock()
+        self._processes: Dict[asyncio.subprocess.Process, Tuple[Optional[int], asyncio.Future]] = {}
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """终止正在运行的命令及其派生的全部进程，之后不再启动新的子进程（可在其他线程中调用）
+
+        支持 pidfd 时直接在当前线程结束进程组（由 pidfd 确认子进程尚未被回收）；
+        否则在子进程所属的事件循环中依据 returncode 判断后再结束。
+        """
+        with self._lock:
+            self._cancelled = True
+            for process, (pidfd, stopped) in self._processes.items():
+                self._kill(process, pidfd, stopped)
+
+    @staticmethod
+    def _kill(
+        process: asyncio.subprocess.Process,
+        pidfd: Optional[int],
+        stopped: asyncio.Future,
+    ) -> None:
+        """结束子进程所在的进程组并通知 _run_command 停止等待（调用方需持有 _lock）"""
+        if pidfd is not None:
+            _kill_group(process, pidfd)
+
+        def notify() -> None:
+            if pidfd is None:
+                _kill_group(process, None)
+            if not stopped.done():
+                stopped.set_result(None)
+
+        stopped.get_loop().call_soon_threadsafe(notify)
+
+    def _track(self, process: asyncio.subprocess.Process) -> Tuple[Optional[int], asyncio.Future]:
+        """登记运行中的子进程，返回其 pidfd（不支持时为 None）和取消通知
+
+        pidfd 在子进程启动之后才打开，期间子进程可能已退出并被回收、PID 被复用，
+        因此 pidfd 本身不代表身份，每次使用前都由 _is_unreaped_child 确认。
+        """
+        pidfd = None
+        if _HAS_PIDFD:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+        stopped = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._processes[process] = (pidfd, stopped)
+            if self._cancelled:
+                # 启动期间已被取消
+                self._kill(process, pidfd, stopped)
+        return pidfd, stopped
+
+    def _untrack(self, process: asyncio.subprocess.Process, pidfd: Optional[int]) -> None:
+        with self._lock:
+            self._processes.pop(process, None)
+            if pidfd is not None:
+                os.close(pidfd)
 
     def _find_venv_appauto(self) -> Optional[str]:
         """查找 venv 中的 appauto 路径
@@ -64,20 +421,32 @@ class CommandExecutor(BaseExecutor):
         # 假设当前工作目录是项目根目录或其子目录
         current_file = Path(__file__)
         project_root = current_file.parent.parent.parent  # 向上三级到项目根
+        cwd = Path.cwd()
+
+        key = (str(project_root), str(cwd))
+        if key in _VENV_APPAUTO_CACHE:
+            return _VENV_APPAUTO_CACHE[key]
 
         # 尝试查找 .venv/bin/appauto
         venv_paths = [
             project_root / ".venv" / "bin" / "appauto",
             project_root / "venv" / "bin" / "appauto",
-            Path.cwd() / ".venv" / "bin" / "appauto",
-            Path.cwd() / "venv" / "bin" / "appauto",
+            cwd / ".venv" / "bin" / "appauto",
+            cwd / "venv" / "bin" / "appauto",
         ]
 
+        found = None
         for venv_path in venv_paths:
-            if venv_path.exists() and venv_path.is_file():
-                return str(venv_path)
+            # 一次 stat 同时判断存在性和文件类型
+            try:
+                if stat.S_ISREG(os.stat(venv_path).st_mode):
+                    found = str(venv_path)
+                    break
+            except OSError:
+                continue
 
-        return None
+        _VENV_APPAUTO_CACHE[key] = found
+        return found
 
     async def execute(self, payload: Dict[str, Any]) -> ExecutionResult:
         """执行命令
@@ -90,21 +459,22 @@ class CommandExecutor(BaseExecutor):
         Returns:
             ExecutionResult: 执行结果
         """
-        command_type = TaskType(payload.get("command_type", self.command_type))
+        # 常见情况下 payload 不指定 command_type，直接使用构造时的类型，省去查表
+        command_type_value = payload.get("command_type")
+        if command_type_value is None:
+            command_type = self.command_type
+        else:
+            command_type = TASK_TYPES_BY_VALUE.get(command_type_value)
+            if command_type is None:
+                raise ValueError(f"{command_type_value!r} is not a valid TaskType")
 
         self.log_info(f"Starting command execution: {command_type}")
 
         try:
-            if command_type == TaskType.PERF_TEST_CMD:
-                return await self._execute_perf_test(payload)
-            elif command_type == TaskType.PYTEST:
-                return await self._execute_pytest(payload)
-            elif command_type == TaskType.ENV_DEPLOY:
-                return await self._execute_env_deploy(payload)
-            elif command_type == TaskType.GENERIC_COMMAND:
-                return await self._execute_generic(payload)
-            else:
+            handler = self._HANDLERS.get(command_type)
+            if handler is None:
                 raise ValueError(f"Unsupported command type: {command_type}")
+            return await handler(self, payload)
 
         except Exception as e:
             self.log_error(f"Command execution failed: {e}")
@@ -132,69 +502,16 @@ class CommandExecutor(BaseExecutor):
         """
         self.log_info("Executing performance test via appauto bench evalscope perf")
 
-        base = payload.get("base", "ft")
-        skip_launch = payload.get("skip_launch", True)
-
-        # 构建命令
-        cmd_parts = [self.appauto_path, "bench", "evalscope", "perf"]
-
-        # 添加基础场景标志
-        if base == "amaas":
-            cmd_parts.append("--base-amaas")
-        else:
-            cmd_parts.append("--base-ft")
-
-        # 是否跳过模型启动
-        if skip_launch:
-            cmd_parts.append("--skip-launch")
-
-        # 添加连接参数
-        if payload.get("ip"):
-            cmd_parts.extend(["--ip", payload["ip"]])
-        if payload.get("port"):
-            cmd_parts.extend(["--port", str(payload["port"])])
-
-        # SSH 参数
-        if payload.get("ssh_user"):
-            cmd_parts.extend(["--ssh-user", payload["ssh_user"]])
-        if payload.get("ssh_password"):
-            cmd_parts.extend(["--ssh-password", payload["ssh_password"]])
-        if payload.get("ssh_port"):
-            cmd_parts.extend(["--ssh-port", str(payload["ssh_port"])])
-
-        # 测试参数
-        if payload.get("parallel"):
-            cmd_parts.extend(["--parallel", str(payload["parallel"])])
-        if payload.get("number"):
-            cmd_parts.extend(["--number", str(payload["number"])])
-
-        # 模型参数
-        if payload.get("model"):
-            cmd_parts.extend(["--model", payload["model"]])
-
-        # 如果不跳过启动，需要 tp 参数
-        if not skip_launch:
-            if payload.get("tp"):
-                cmd_parts.extend(["--tp", str(payload["tp"])])
-            if payload.get("launch_timeout"):
-                cmd_parts.extend(["--launch-timeout", str(payload["launch_timeout"])])
-
-        # 可选参数
-        if payload.get("tokenizer_path"):
-            cmd_parts.extend(["--tokenizer-path", payload["tokenizer_path"]])
-        if payload.get("input_length"):
-            cmd_parts.extend(["--input-length", str(payload["input_length"])])
-        if payload.get("output_length"):
-            cmd_parts.extend(["--output-length", str(payload["output_length"])])
-        if payload.get("loop"):
-            cmd_parts.extend(["--loop", str(payload["loop"])])
-        if payload.get("debug"):
-            cmd_parts.append("--debug")
-        if payload.get("keep_model"):
-            cmd_parts.append("--keep-model")
+        # 构建命令：基础场景和是否跳过模型启动决定固定选项与参数表（不跳过启动时还需要 tp 等参数），
+        # 其余参数按参数表生成
+        flags, specs = PERF_MODES[
+            (payload.get("base", "ft") == "amaas", bool(payload.get("skip_launch", True)))
+        ]
+        cmd_parts = [*self._prefixes[TaskType.PERF_TEST_CMD], *flags]
+        extend_args(cmd_parts, payload, specs)
 
         # 执行命令（appauto 会自动生成输出文件）
-        return await self._run_command(cmd_parts)
+        return await self._run_command(cmd_parts, cpus=PERF_CHILD_CPUS)
 
     async def _execute_pytest(self, payload: Dict[str, Any]) -> ExecutionResult:
         """执行 pytest 测试
@@ -217,20 +534,11 @@ class CommandExecutor(BaseExecutor):
         self.log_info("Executing pytest via appauto run pytest")
 
         scenario = payload.get("scenario", "amaas")
-        ssh_config = payload.get("ssh_config", {})
-
-        # 构建命令
-        cmd_parts = [self.appauto_path, "run", "pytest"]
+        ssh_config = payload.get("ssh_config") or {}
 
-        # 添加飞书用户（可选）
-        lark_user = payload.get("lark_user")
-        if lark_user:
-            cmd_parts.extend(["--lark-user", lark_user])
-
-        # 添加主题（可选）
-        topic = payload.get("topic")
-        if topic:
-            cmd_parts.extend(["--topic", topic])
+        # 构建命令，添加飞书用户、主题（可选）
+        cmd_parts = [*self._prefixes[TaskType.PYTEST]]
+        extend_args(cmd_parts, payload, PYTEST_NOTIFY_ARGS)
 
         # 添加测试路径
         testpaths = payload.get("testpaths")
@@ -242,46 +550,18 @@ class CommandExecutor(BaseExecutor):
                 testpaths = "testcases/sanity_check/ft/test_ft.py"
         cmd_parts.extend(["--testpaths", testpaths])
 
-        # 添加 IP（从 ssh_config 获取）
-        if ssh_config and ssh_config.get("host"):
-            cmd_parts.extend(["--ip", ssh_config["host"]])
-
-        # 添加测试级别
-        case_level = payload.get("case_level")
-        if case_level:
-            cmd_parts.extend(["--case-level", case_level])
-
-        # 添加模型优先级
-        model_priority = payload.get("model_priority")
-        if model_priority:
-            cmd_parts.extend(["--model_priority", model_priority])
-
-        # 添加 SSH 用户和端口
-        if ssh_config:
-            if ssh_config.get("user"):
-                cmd_parts.extend(["--ssh_user", ssh_config["user"]])
-            if ssh_config.get("port"):
-                cmd_parts.extend(["--ssh_port", str(ssh_config["port"])])
-
-        # 添加通知组（可选）
-        notify_group = payload.get("notify_group")
-        if notify_group:
-            cmd_parts.extend(["--notify-group", notify_group])
-
-        # 添加报告服务器（可选）
-        report_server = payload.get("report_server")
-        if report_server:
-            cmd_parts.extend(["--report-server", report_server])
-
-        # 添加报告 URL（可选）
-        report_url = payload.get("report_url")
-        if report_url:
-            cmd_parts.extend(["--report-url", report_url])
+        # 添加 IP（从 ssh_config 获取）、测试级别、模型优先级、SSH 用户和端口
+        extend_args(cmd_parts, ssh_config, PYTEST_HOST_ARGS)
+        extend_args(cmd_parts, payload, PYTEST_LEVEL_ARGS)
+        extend_args(cmd_parts, ssh_config, PYTEST_SSH_ARGS)
+
+        # 添加通知组、报告服务器、报告 URL（可选）
+        extend_args(cmd_parts, payload, PYTEST_REPORT_ARGS)
 
         # 添加额外的 pytest 参数
         pytest_args = payload.get("pytest_args", [])
         if isinstance(pytest_args, str):
-            pytest_args = shlex.split(pytest_args)
+            pytest_args = _split_args(pytest_args)
         cmd_parts.extend(pytest_args)
 
         return await self._run_command(cmd_parts)
@@ -302,13 +582,9 @@ class CommandExecutor(BaseExecutor):
         if not env_name:
             raise ValueError("env_name is required for environment deployment")
 
-        # 构建命令
-        cmd_parts = [self.appauto_path, "env", "deploy", env_name]
-
-        # 添加配置文件
-        deploy_config = payload.get("deploy_config")
-        if deploy_config:
-            cmd_parts.extend(["--config", deploy_config])
+        # 构建命令，添加配置文件（可选）
+        cmd_parts = [*self._prefixes[TaskType.ENV_DEPLOY], env_name]
+        extend_args(cmd_parts, payload, ENV_DEPLOY_ARGS)
 
         return await self._run_command(cmd_parts)
 
@@ -321,19 +597,16 @@ class CommandExecutor(BaseExecutor):
         """
         self.log_info("Executing generic appauto command")
 
-        command = payload.get("command")
-        if not command:
+        cmd_parts = normalize_command(payload.get("command"))
+        if not cmd_parts:
             raise ValueError("command is required for generic execution")
 
-        # 支持字符串或数组格式
-        if isinstance(command, str):
-            cmd_parts = shlex.split(command)
-        else:
-            cmd_parts = command
-
-        # 如果命令不是以 appauto 开头，添加前缀
-        if cmd_parts[0] != self.appauto_path and not cmd_parts[0].endswith("appauto"):
-            cmd_parts = [self.appauto_path] + cmd_parts
+        # 如果命令不是以 appauto 开头，添加前缀；裸的 "appauto" 替换为已解析的路径
+        program = cmd_parts[0]
+        if program == "appauto":
+            cmd_parts = [self.appauto_path, *cmd_parts[1:]]
+        elif program != self.appauto_path and not program.endswith("appauto"):
+            cmd_parts = [self.appauto_path, *cmd_parts]
 
         return await self._run_command(cmd_parts)
 
@@ -341,73 +614,124 @@ class CommandExecutor(BaseExecutor):
         self,
         cmd_parts: List[str],
         output_file: Optional[str] = None,
+        cpus: FrozenSet[int] = frozenset(),
     ) -> ExecutionResult:
         """运行命令并捕获输出
 
         Args:
             cmd_parts: 命令参数列表
             output_file: 预期的输出文件路径
+            cpus: 子进程绑定的 CPU 集合（为空时不绑定）
 
         Returns:
             ExecutionResult: 执行结果
         """
-        cmd_str = " ".join(shlex.quote(part) for part in cmd_parts)
-        self.log_info(f"Running command: {cmd_str}")
+        self.log_info("Running command: %s", _LazyCommand(cmd_parts))
+        if self._cancelled:
+            return ExecutionResult(
+                success=False,
+                summary={"error": CANCELLED_ERROR, "cancelled": True},
+                error=CANCELLED_ERROR,
+            )
 
         try:
             # 执行命令
+            # 注意：执行器运行在调度线程各自创建的事件循环中，子进程退出需由默认的
+            # ThreadedChildWatcher 监听；Python 3.12 之前的 PidfdChildWatcher 只能绑定单个
+            # 事件循环，在非主线程中会报 "child watcher is not activated"，不能替换
             process = await asyncio.create_subprocess_exec(
                 *cmd_parts,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT,
+                env=self._env,
+                # 独立的会话和进程组：取消或超时时按进程组结束 appauto 派生的全部进程
+                start_new_session=True,
+            )
+            if cpus:
+                self._pin_process(process.pid, cpus)
+
+            # 逐行读取两个输出流并即时解析，只保留开头和末尾若干行（保持 bytes，结束时再解码）
+            # 解析结果直接写入 summary；partial 在 C 层绑定参数，每行少一层 Python 调用
+            summary: Dict[str, Any] = {}
+            stdout_buffer = OutputBuffer()
+            stderr_buffer = OutputBuffer()
+            on_stdout = partial(self._parse_line, summary=summary)
+
+            # 等待命令完成（带超时）；超时或被取消时保留已读取的输出
+            abort_error = None
+            pidfd, stopped = self._track(process)
+            waiter = asyncio.ensure_future(
+                wait_process(process, self.timeout, stdout_buffer, stderr_buffer, on_stdout)
             )
-
-            # 等待命令完成（带超时）
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.timeout,
-                )
+                await asyncio.wait((waiter, stopped), return_when=asyncio.FIRST_COMPLETED)
+                if waiter.done():
+                    await waiter
+                else:
+                    # 被取消：进程组已结束；若 appauto 先于取消退出，其派生的进程可能仍持有输出管道，不再等待读取完毕
+                    waiter.cancel()
+                    await asyncio.gather(waiter, return_exceptions=True)
+                    await process.wait()
             except asyncio.TimeoutError:
-                process.kill()
+                _kill_group(process, pidfd)
                 await process.wait()
-                raise TimeoutError(f"Command timeout after {self.timeout} seconds")
-
-            # 解码输出
-            stdout_str = stdout.decode("utf-8") if stdout else ""
-            stderr_str = stderr.decode("utf-8") if stderr else ""
-
-            # 记录输出
-            if stdout_str:
-                self.log_info(f"STDOUT:\n{stdout_str}")
-            if stderr_str:
-                self.log_error(f"STDERR:\n{stderr_str}")
+                abort_error = f"Command timeout after {self.timeout} seconds"
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+                self._untrack(process, pidfd)
+            if self._cancelled:
+                abort_error = CANCELLED_ERROR
+                summary["cancelled"] = True
+
+            stdout_bytes = stdout_buffer.getvalue()
+            stderr_bytes = stderr_buffer.getvalue()
+            stdout_str = stdout_bytes.decode("utf-8", errors="replace")
+            stderr_str = stderr_bytes.decode("utf-8", errors="replace")
 
             # 检查退出码
             exit_code = process.returncode
             success = exit_code == 0
 
-            # 尝试从输出中解析结果
-            summary = self._parse_output(stdout_str, stderr_str)
+            # 记录输出（只记录末尾 MAX_LOG_BYTES）和执行状态，合并为一次文件写入。
+            # 完整输出按 DEBUG 记录（stderr 仅在失败时按 ERROR），LLM_PERF_TASK_LOG_LEVEL=INFO
+            # 时不会截取、解码和写入这部分内容
+            failed = bool(abort_error) or not success
+            with self.logger.batch():
+                if stdout_bytes:
+                    self.log_debug("STDOUT:\n%s", _LazyOutput(stdout_bytes))
+                if stderr_bytes:
+                    log_stderr = self.log_error if failed else self.log_debug
+                    log_stderr("STDERR:\n%s", _LazyOutput(stderr_bytes))
+                if abort_error:
+                    self.log_error("Command execution error: %s", abort_error)
+                elif not success:
+                    self.log_error("Command failed with exit code %s", exit_code)
+                else:
+                    self.log_info("Command completed successfully")
+
+            # 如果没有找到结构化信息，保留 stdout 开头的部分内容（直接切片已解码的输出，不再重复拼接解码）
+            if not summary:
+                summary["raw_output"] = stdout_str[:RAW_OUTPUT_CHARS]
+            if stdout_buffer.dropped or stderr_buffer.dropped:
+                summary["output_truncated"] = True
             summary["exit_code"] = exit_code
 
-            if not success:
+            # 超时/取消优先于退出码；成功、失败共用一次结果构造
+            if abort_error:
+                summary["error"] = abort_error
+                error_msg = abort_error
+            elif not success:
                 error_msg = stderr_str or f"Command failed with exit code {exit_code}"
-                self.log_error(f"Command failed: {error_msg}")
-                return ExecutionResult(
-                    success=False,
-                    summary=summary,
-                    error=error_msg,
-                    stdout=stdout_str,
-                    stderr=stderr_str,
-                    exit_code=exit_code,
-                )
-
-            self.log_info("Command completed successfully")
+            else:
+                error_msg = None
+
             return ExecutionResult(
-                success=True,
+                success=error_msg is None,
                 summary=summary,
-                output_file=output_file,
+                error=error_msg,
+                output_file=output_file if error_msg is None else None,
                 stdout=stdout_str,
                 stderr=stderr_str,
                 exit_code=exit_code,
@@ -421,54 +745,61 @@ class CommandExecutor(BaseExecutor):
                 error=str(e),
             )
 
-    def _parse_output(self, stdout: str, stderr: str) -> Dict[str, Any]:
-        """解析命令输出
+    def _pin_process(self, pid: int, cpus: FrozenSet[int]) -> None:
+        """在父进程中绑定子进程的 CPU 亲和性
+
+        不使用 preexec_fn：它在多线程进程中不安全，并且会禁用 posix_spawn 快速路径。
+        子进程启动后立即绑定，appauto 之后派生的进程会继承该亲和性。
+        """
+        try:
+            allowed = cpus & os.sched_getaffinity(0)
+            if allowed:
+                os.sched_setaffinity(pid, allowed)
+                self.log_debug("Pinned pid %s to CPUs %s", pid, sorted(allowed))
+        except OSError as e:
+            # 子进程可能已退出；绑定失败不影响命令执行
+            self.log_debug("Failed to pin pid %s: %s", pid, e)
+
+    def _parse_line(self, line: bytes, summary: Dict[str, Any]) -> None:
+        """解析单行命令输出
 
         尝试从输出中提取结构化信息，包括 appauto 生成的文件路径
 
         Args:
-            stdout: 标准输出
-            stderr: 错误输出
-
-        Returns:
-            解析后的摘要信息
+            line: 一行标准输出（原始字节）
+            summary: 解析结果写入的摘要字典
         """
-        summary = {}
-
-        # 尝试从 stdout 中查找 JSON 输出
-        # appauto 可能会输出 JSON 格式的结果
-        try:
-            # 查找 JSON 块
-            for line in stdout.split("\n"):
-                line = line.strip()
-                if line.startswith("{") and line.endswith("}"):
-                    try:
-                        data = json.loads(line)
-                        summary.update(data)
-                    except json.JSONDecodeError:
-                        pass
-        except Exception:
-            pass
-
-        # 解析 appauto 生成的文件路径
-        # 查找类似 "The performance test data has been saved to: xxx.csv, xxx.xlsx" 的行
-        import re
-        xlsx_pattern = r'saved to:.*?([a-f0-9\-]+_\d{8}_\d{6}\.xlsx)'
-        csv_pattern = r'saved to:.*?([a-f0-9\-]+_\d{8}_\d{6}\.csv)'
-
-        for line in stdout.split("\n"):
-            xlsx_match = re.search(xlsx_pattern, line)
-            if xlsx_match:
-                summary["output_xlsx"] = xlsx_match.group(1)
-                self.log_info(f"Found appauto generated xlsx: {xlsx_match.group(1)}")
-
-            csv_match = re.search(csv_pattern, line)
-            if csv_match:
-                summary["output_csv"] = csv_match.group(1)
-                self.log_info(f"Found appauto generated csv: {csv_match.group(1)}")
-
-        # 如果没有找到 JSON，提取一些基本信息
-        if not summary:
-            summary["raw_output"] = stdout[:1000]  # 只保留前1000字符
-
-        return summary
+        # 绝大多数行既不含 "{" 也不含提示语，只用子串查找（C 层快速搜索）判断，不执行正则
+        if b"{" in line:
+            # appauto 可能会输出 JSON 格式的结果：只尝试整行为 JSON 对象的行，
+            # 不在任意位置的 "{" 处解码，避免误把普通日志中的花括号片段当作结果
+            stripped = line.strip()
+            if stripped.startswith(b"{") and stripped.endswith(b"}"):
+                try:
+                    summary.update(json.loads(stripped))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass
+        marker = line.find(_SAVED_TO_MARKER)
+        if marker < 0:
+            return
+
+        # 解析 appauto 生成的文件路径（每种扩展名取提示行中的第一个）
+        found = set()
+        for match in _OUTPUT_FILE_PATTERN.finditer(line, marker + len(_SAVED_TO_MARKER)):
+            ext = match.group(1).decode("ascii")
+            if ext in found:
+                continue
+            found.add(ext)
+            file_name = match.group(0).decode("ascii")
+            summary[f"output_{ext}"] = file_name
+            self.log_info("Found appauto generated %s: %s", ext, file_name)
+            if len(found) == _OUTPUT_FILE_EXT_COUNT:
+                break
+
+    # 命令类型 -> 处理方法
+    _HANDLERS = {
+        TaskType.PERF_TEST_CMD: _execute_perf_test,
+        TaskType.PYTEST: _execute_pytest,
+        TaskType.ENV_DEPLOY: _execute_env_deploy,
+        TaskType.GENERIC_COMMAND: _execute_generic,
+    }
@@ -2,16 +2,206 @@
 
 通过 SSH 连接到远程机器，收集硬件配置信息，生成详细的硬件报告。
 """
+import asyncio
+import csv
 import json
-from datetime import datetime
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import BinaryIO, Dict, Any, Optional, Tuple
 
 from llm_perf_platform.executor.base_executor import BaseExecutor, ExecutionResult
 from llm_perf_platform.executor.ssh_client import SSHClient
 from llm_perf_platform.storage.results import RESULTS_DIR
 
 
+def _dump_json(value: Any) -> bytes:
+    """硬件报告的序列化：2 空格缩进的 UTF-8"""
+    return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_report(file: BinaryIO, info: Dict[str, Any]) -> None:
+    """按顶层字段逐段序列化并写入，不在内存中拼出整份报告
+
+    每段单独缩进后再整体右移两格（JSON 字符串中的换行已转义，替换换行符是安全的），
+    输出与对整个字典做一次 indent=2 序列化逐字节一致。
+    """
+    if not info:
+        file.write(b"{}")
+        return
+    separator = b"{\n  "
+    for key, value in info.items():
+        file.write(separator)
+        file.write(_dump_json(key))
+        file.write(b": ")
+        file.write(_dump_json(value).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    file.write(b"\n}")
+
+
+# dmidecode 内存设备字段名 -> 报告中的键名
+_DIMM_FIELDS = {
+    "Size": "size",
+    "Type": "type",
+    "Speed": "speed",
+    "Configured Memory Speed": "configured_speed",
+    "Manufacturer": "manufacturer",
+    "Part Number": "part_number",
+    "Locator": "locator",
+    "Form Factor": "form_factor",
+}
+# jc --dmidecode 输出的 values 键名（字段名小写、空格换成下划线）-> 报告中的键名
+_DIMM_JC_FIELDS = {key.lower().replace(" ", "_"): name for key, name in _DIMM_FIELDS.items()}
+# 一次正则扫描取出每个 "Memory Device" 条目（标题行之后的缩进行），
+# 再在条目内只匹配关心的字段行，不再逐行 strip / split
+_DMI_DEVICE_PATTERN = re.compile(r"^[ \t]*Memory Device[^\n]*\n((?:[ \t]+[^\n]*(?:\n|$))+)", re.MULTILINE)
+_DMI_FIELD_PATTERN = re.compile(
+    rf"^[ \t]*({'|'.join(map(re.escape, _DIMM_FIELDS))})[ \t]*:(.*)$", re.MULTILINE
+)
+# lscpu 的 "字段: 值" 行；新版 lscpu 会缩进子字段（如 Vendor ID 下的 Model name）
+_LSCPU_FIELD_PATTERN = re.compile(r"^[ \t]*([^:\n]+?):[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+# free -m 的 Mem 行：total used free shared buff/cache available，只取需要的四列
+_FREE_MEM_PATTERN = re.compile(
+    r"^Mem:\s+(?P<total>\d+)\s+(?P<used>\d+)\s+(?P<free>\d+)\s+\d+\s+\d+\s+(?P<available>\d+)",
+    re.MULTILINE,
+)
+# 内存条容量（如 "32 GB"、"16384 MB"），单位 -> GB 换算系数
+_DIMM_SIZE_PATTERN = re.compile(r"(\d+)\s*(TB|GB|MB)")
+_DIMM_SIZE_UNITS_GB = {"TB": 1024, "GB": 1, "MB": 1 / 1024}
+
+# 探测名 -> 远程命令；全部拼接为一个脚本，一次 SSH 往返执行完毕。
+# 只执行原始命令，不在远程用 grep/cut/awk 管道过滤（每个管道多 fork 几个进程），过滤和解析都在本地完成。
+# 本地按字段名解析 lscpu、free 的输出，脚本以 LC_ALL=C 执行，字段名不随远程主机的语言环境翻译
+_HW_PROBES = {
+    "gpu": "nvidia-smi --query-gpu=index,name,driver_version,memory.total,memory.free,memory.used,temperature.gpu,utilization.gpu --format=csv,noheader,nounits 2>/dev/null || echo 'No NVIDIA GPU'",
+    # 核心数、型号、架构都取自同一次 lscpu 输出，在本地解析
+    "cpu": "lscpu",
+    "memory": "free -m",
+    # 需要 root 权限，如果失败则跳过；远程装有 jc 时先转换为 JSON，本地只需 json.loads，否则输出原始文本
+    "dimm": (
+        "if out=$(sudo dmidecode -t memory 2>/dev/null || dmidecode -t memory 2>/dev/null); then "
+        "printf '%s\\n' \"$out\" | jc --dmidecode 2>/dev/null || printf '%s\\n' \"$out\"; "
+        "else false; fi"
+    ),
+    "disk": "df -h 2>/dev/null",
+    "os_name": "cat /etc/os-release",
+    "kernel": "uname -r",
+    "hostname": "hostname",
+    "primary_ip": "hostname -I",
+    # 机器标识：静态探测缓存按机器区分，而不是按地址（IP 被复用给其他机器时不会读到旧机器的数据）
+    "machine_id": "cat /etc/machine-id 2>/dev/null || hostname",
+}
+
+# 同一主机两次采集之间几乎不会变化的探测（CPU、内存条、系统版本等）-> 缓存有效期（秒），
+# 成功的输出按主机缓存；GPU（利用率/温度/显存）、内存与磁盘使用量、IP 每次都重新采集
+_STATIC_PROBE_TTLS = {
+    "cpu": 24 * 3600,
+    "dimm": 30 * 24 * 3600,
+    "os_name": 24 * 3600,
+    "kernel": 24 * 3600,
+    "hostname": 24 * 3600,
+}
+_STATIC_PROBES = frozenset(_STATIC_PROBE_TTLS)
+# 静态探测 -> 由其输出解析出的报告字段（"os.name" 表示 info["os"]["name"]），用于在元数据中标记取自缓存的字段
+_STATIC_PROBE_FIELDS = {
+    "cpu": ("cpu_cores", "cpu_model", "cpu_arch"),
+    "dimm": (
+        "memory_devices", "memory_module_count", "memory_hardware_total_gb",
+        "memory_type", "memory_speed", "memory_configured_speed",
+    ),
+    "os_name": ("os.name",),
+    "kernel": ("os.kernel_version",),
+    "hostname": ("os.hostname",),
+}
+# 静态探测缓存持久化到结果目录，服务重启后仍然有效
+_STATIC_CACHE_FILE = RESULTS_DIR / ".hw_cache.json"
+# 保护 HardwareInfoExecutor._STATIC_CACHE 的加载和读写（各调度线程共享同一份缓存）
+_STATIC_CACHE_LOCK = threading.Lock()
+# 串行化缓存文件的写入：每次在该锁内取最新快照，后写入的文件总包含之前的全部更新
+_STATIC_CACHE_STORE_LOCK = threading.Lock()
+# 未检测到 NVIDIA GPU 的主机在该时间内跳过 nvidia-smi 探测（考虑到可能热插拔，不永久缓存）
+_NO_GPU_TTL = 3600
+
+# 各探测命令在远程以后台任务并发执行，输出和退出码写入临时目录，全部结束后按固定顺序输出，
+# 耗时取决于最慢的一条命令（通常是 nvidia-smi / dmidecode）而不是所有命令之和。
+# 每段输出后跟一行结束标记（含探测名和退出码），用于切分各段输出
+_SECTION_END = "__HWINFO_END__"
+
+
+@lru_cache(maxsize=None)
+def _build_script(names: Tuple[str, ...]) -> str:
+    """将指定探测拼接为一个并发执行的 shell 脚本（探测组合只有少数几种，按组合缓存）"""
+    return "\n".join([
+        'export LC_ALL=C',
+        'd=$(mktemp -d) || exit 1',
+        *(
+            f'( ( {_HW_PROBES[name]} ) >"$d/{name}"; echo $? >"$d/{name}.rc" ) &'
+            for name in names
+        ),
+        'wait',
+        f'for n in {" ".join(names)}; do',
+        '  cat "$d/$n" 2>/dev/null',
+        f'  printf \'\\n%s %s %s\\n\' {_SECTION_END} "$n" "$(cat "$d/$n.rc" 2>/dev/null || echo 1)"',
+        'done',
+        'rm -rf "$d"',
+    ])
+
+
+def _load_static_cache() -> Dict[str, Dict[str, Any]]:
+    """读取静态探测缓存
+
+    格式：{"hosts": {"主机:端口": 机器标识}, "machines": {机器标识: {探测名: [过期时间戳, 探测命令, 输出, 采集时间戳]}}}；
+    文件不存在、损坏或是旧格式时返回空缓存。
+    """
+    try:
+        with _STATIC_CACHE_FILE.open("rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+    if (
+        isinstance(cache, dict)
+        and isinstance(cache.get("hosts"), dict)
+        and isinstance(cache.get("machines"), dict)
+    ):
+        return cache
+    return {"hosts": {}, "machines": {}}
+
+
+def _store_static_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """原子地写入静态探测缓存的快照（先写临时文件再替换，并发任务不会读到半个文件）"""
+    data = _dump_json(cache)
+    _STATIC_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=_STATIC_CACHE_FILE.parent, suffix=".tmp", delete=False) as f:
+        f.write(data)
+    os.replace(f.name, _STATIC_CACHE_FILE)
+
+
+_SECTION_END_PATTERN = re.compile(rf"^{_SECTION_END} (\w+) (\d+)$", re.MULTILINE)
+
+
+def _metric(value: str) -> Optional[int]:
+    """nvidia-smi 数值字段转为整数；不支持的指标输出 "N/A"，返回 None"""
+    return None if value == "N/A" else int(float(value))
+
+
+def _split_sections(stdout: str) -> Dict[str, Tuple[str, int]]:
+    """将合并脚本的输出切分为 探测名 -> (去除首尾空白的输出, 退出码)
+
+    未输出结束标记的探测（脚本中途中断）视为失败，输出为空。
+    """
+    sections = {name: ("", 1) for name in _HW_PROBES}
+    start = 0
+    for match in _SECTION_END_PATTERN.finditer(stdout):
+        sections[match.group(1)] = (stdout[start:match.start()].strip(), int(match.group(2)))
+        start = match.end()
+    return sections
+
+
 class HardwareInfoExecutor(BaseExecutor):
     """硬件信息收集执行器
 
@@ -26,6 +216,11 @@ class HardwareInfoExecutor(BaseExecutor):
     - 网络信息（ifconfig/ip addr）
     """
 
+    # 静态探测缓存（格式见 _load_static_cache）；各调度线程共享（读写需持有 _STATIC_CACHE_LOCK），首次采集时从 _STATIC_CACHE_FILE 加载
+    _STATIC_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+    # (主机, 端口) -> 跳过 GPU 探测的截止时间
+    _NO_GPU_HOSTS: Dict[Tuple[str, int], float] = {}
+
     def __init__(self, task_id: int, timeout: int = 300):
         """初始化硬件信息收集执行器
 
@@ -47,6 +242,7 @@ class HardwareInfoExecutor(BaseExecutor):
                     - user: 用户名
                     - password/key_path: 认证信息
                 - display_id: 显示 ID（用于文件命名）
+                - force_refresh: 是否忽略静态探测缓存和"无 GPU"记录、重新采集全部信息（可选，默认 False）
 
         Returns:
             ExecutionResult: 执行结果，包含硬件信息 JSON 文件路径
@@ -71,18 +267,23 @@ class HardwareInfoExecutor(BaseExecutor):
                 self.log_info("SSH connection established")
 
                 # 收集硬件信息
-                hardware_info = await self._collect_hardware_info(ssh)
+                hardware_info = await self._collect_hardware_info(
+                    ssh, force_refresh=bool(payload.get("force_refresh"))
+                )
 
-                # 添加元数据
+                # 添加元数据（并入采集时记录的缓存信息）；采集时间只取一次，
+                # 元数据（带时区的 UTC 时间）与文件名（本地时间）由同一时刻生成
+                collected_at = datetime.now(timezone.utc)
                 hardware_info["metadata"] = {
-                    "collection_time": datetime.utcnow().isoformat(),
+                    "collection_time": collected_at.isoformat(),
                     "task_id": self.task_id,
                     "display_id": display_id,
                     "remote_host": ssh_config.get("host"),
+                    **hardware_info.pop("metadata", {}),
                 }
 
                 # 保存到 JSON 文件
-                output_file = await self._save_hardware_info(display_id, hardware_info)
+                output_file = await self._save_hardware_info(display_id, hardware_info, collected_at)
 
                 self.log_info(f"Hardware info collected successfully: {output_file}")
 
@@ -96,6 +297,7 @@ class HardwareInfoExecutor(BaseExecutor):
                         "gpu_count": len(hardware_info.get("gpus", [])),
                         "cpu_count": hardware_info.get("cpu_cores", 0),
                         "memory_total_gb": hardware_info.get("memory_total_gb", 0),
+                        "gpu_probe_skipped": hardware_info["metadata"]["gpu_probe_skipped"],
                     },
                 )
 
@@ -108,90 +310,188 @@ class HardwareInfoExecutor(BaseExecutor):
                 error=error_msg,
             )
 
-    async def _collect_hardware_info(self, ssh: SSHClient) -> Dict[str, Any]:
+    @classmethod
+    def _ensure_static_cache(cls) -> None:
+        """首次采集时从 _STATIC_CACHE_FILE 加载静态探测缓存（读文件，在线程中调用）"""
+        with _STATIC_CACHE_LOCK:
+            if cls._STATIC_CACHE is None:
+                cls._STATIC_CACHE = _load_static_cache()
+
+    @classmethod
+    def _persist_static_cache(cls) -> None:
+        """将静态探测缓存写入文件（在线程中调用）；缓存锁内只复制快照，序列化和写文件在锁外进行"""
+        with _STATIC_CACHE_STORE_LOCK:
+            with _STATIC_CACHE_LOCK:
+                snapshot = {
+                    "hosts": dict(cls._STATIC_CACHE["hosts"]),
+                    "machines": {
+                        machine_id: dict(entries)
+                        for machine_id, entries in cls._STATIC_CACHE["machines"].items()
+                    },
+                }
+            _store_static_cache(snapshot)
+
+    @classmethod
+    def _lookup_static_cache(cls, machine_id: Optional[str], now: float) -> Dict[str, list]:
+        """取出该机器仍在有效期内的静态探测缓存条目；探测命令变化后（如升级后输出格式不同）旧缓存自动失效"""
+        if not machine_id:
+            return {}
+        with _STATIC_CACHE_LOCK:
+            entries = dict(cls._STATIC_CACHE["machines"].get(machine_id, {}))
+        return {
+            name: entry
+            for name, entry in entries.items()
+            if name in _STATIC_PROBES and len(entry) == 4 and entry[0] > now and entry[1] == _HW_PROBES[name]
+        }
+
+    async def _collect_hardware_info(self, ssh: SSHClient, force_refresh: bool = False) -> Dict[str, Any]:
         """收集所有硬件信息
 
+        所有探测命令合并为一个脚本，只执行一次 SSH 命令（一次往返），再按段分别解析。
+        静态探测在各自的缓存有效期（_STATIC_PROBE_TTLS）内不再执行，直接使用该地址上次对应机器的缓存输出；
+        脚本同时读取机器标识，地址对应的机器已变化时（如 IP 被复用）再补采这些静态探测。
+        最近确认没有 NVIDIA GPU 的主机不再执行 nvidia-smi（metadata.gpu_probe_skipped 为 True）。
+
         Args:
             ssh: SSH 客户端
+            force_refresh: 为 True 时忽略静态探测缓存和"无 GPU"记录，全部重新采集
 
         Returns:
-            包含所有硬件信息的字典
+            包含所有硬件信息的字典；metadata.cached_fields 列出取自缓存的字段及其实际采集时间
         """
-        info = {}
-
-        # GPU 信息
-        self.log_info("Collecting GPU information...")
-        gpu_info = await self._collect_gpu_info(ssh)
-        info["gpus"] = gpu_info
-
-        # CPU 信息
-        self.log_info("Collecting CPU information...")
-        cpu_info = await self._collect_cpu_info(ssh)
-        info.update(cpu_info)
-
-        # 内存信息
-        self.log_info("Collecting memory information...")
-        memory_info = await self._collect_memory_info(ssh)
-        info.update(memory_info)
-
-        # 磁盘信息
-        self.log_info("Collecting disk information...")
-        disk_info = await self._collect_disk_info(ssh)
-        info["disks"] = disk_info
-
-        # 操作系统信息
-        self.log_info("Collecting OS information...")
-        os_info = await self._collect_os_info(ssh)
-        info["os"] = os_info
-
-        # 网络信息
-        self.log_info("Collecting network information...")
-        network_info = await self._collect_network_info(ssh)
-        info["network"] = network_info
+        host_key = f"{ssh.host}:{ssh.port}"
+        if HardwareInfoExecutor._STATIC_CACHE is None:
+            await asyncio.to_thread(self._ensure_static_cache)
+        now = time.time()
+        known_id = None
+        if not force_refresh:
+            with _STATIC_CACHE_LOCK:
+                known_id = self._STATIC_CACHE["hosts"].get(host_key)
+        cached = self._lookup_static_cache(known_id, now)
+
+        gpu_key = (ssh.host, ssh.port)
+        skip_gpu = not force_refresh and self._NO_GPU_HOSTS.get(gpu_key, 0.0) > time.monotonic()
+        if skip_gpu:
+            self.log_info("No NVIDIA GPU found on this host recently, skipping GPU probe")
+
+        # 未执行的探测按失败处理，跳过 GPU 探测时解析结果为空列表
+        names = tuple(
+            name for name in _HW_PROBES
+            if name not in cached and not (skip_gpu and name == "gpu")
+        )
+
+        if cached:
+            self.log_info(f"Collecting hardware information ({len(cached)} static probes cached)...")
+        else:
+            self.log_info("Collecting hardware information...")
+        stdout, _, _ = await ssh.execute(_build_script(names), timeout=self.timeout)
+        sections = _split_sections(stdout)
+
+        # 无法识别机器时不使用也不写入缓存
+        machine_id, returncode = sections["machine_id"]
+        machine_id = machine_id if returncode == 0 else ""
+        if cached and machine_id != known_id:
+            # 该地址已换成另一台机器：改用这台机器自己的缓存，没有的静态探测再补采一次
+            self.log_info(f"Machine at {host_key} has changed, re-collecting static hardware info")
+            reusable = self._lookup_static_cache(machine_id, now)
+            missing = tuple(name for name in cached if name not in reusable)
+            cached = {name: reusable[name] for name in cached if name in reusable}
+            if missing:
+                stdout, _, _ = await ssh.execute(_build_script(missing), timeout=self.timeout)
+                rerun = _split_sections(stdout)
+                sections.update({name: rerun[name] for name in missing})
+                names += missing
+        sections.update({name: (entry[2], 0) for name, entry in cached.items()})
+
+        # 只缓存成功的静态探测，失败的（如没有 sudo 权限时的 dmidecode）下次重新执行
+        fresh = {
+            name: [now + _STATIC_PROBE_TTLS[name], _HW_PROBES[name], sections[name][0], now]
+            for name in names
+            if name in _STATIC_PROBES and sections[name][1] == 0
+        }
+        if machine_id:
+            with _STATIC_CACHE_LOCK:
+                changed = bool(fresh) or self._STATIC_CACHE["hosts"].get(host_key) != machine_id
+                if changed:
+                    self._STATIC_CACHE["hosts"][host_key] = machine_id
+                    self._STATIC_CACHE["machines"].setdefault(machine_id, {}).update(fresh)
+            if changed:
+                try:
+                    await asyncio.to_thread(self._persist_static_cache)
+                except Exception as e:
+                    # 缓存只是优化，持久化失败不影响本次采集
+                    self.log_info(f"Failed to persist hardware info cache: {e}")
+
+        if not skip_gpu:
+            if sections["gpu"][0] == "No NVIDIA GPU":
+                self._NO_GPU_HOSTS[gpu_key] = time.monotonic() + _NO_GPU_TTL
+            else:
+                self._NO_GPU_HOSTS.pop(gpu_key, None)
 
+        info = {}
+        info["gpus"] = self._parse_gpu_info(sections)
+        info.update(self._parse_cpu_info(sections))
+        info.update(self._parse_memory_info(sections))
+        info["disks"] = self._parse_disk_info(sections)
+        info["os"] = self._parse_os_info(sections)
+        info["network"] = self._parse_network_info(sections)
+        info["metadata"] = {
+            "cached_fields": self._cached_fields(info, cached),
+            "gpu_probe_skipped": skip_gpu,
+        }
         return info
 
-    async def _collect_gpu_info(self, ssh: SSHClient) -> list:
-        """收集 GPU 信息"""
-        cmd = "nvidia-smi --query-gpu=index,name,driver_version,memory.total,memory.free,memory.used,temperature.gpu,utilization.gpu --format=csv,noheader,nounits 2>/dev/null || echo 'No NVIDIA GPU'"
-        stdout, stderr, returncode = await ssh.execute(cmd)
-
-        if returncode != 0 or stdout.strip() == "No NVIDIA GPU":
+    @staticmethod
+    def _cached_fields(info: Dict[str, Any], cached: Dict[str, list]) -> Dict[str, str]:
+        """报告中取自静态探测缓存的字段 -> 该值实际采集的时间（UTC ISO 格式）"""
+        fields = {}
+        for name, entry in cached.items():
+            collected_at = datetime.fromtimestamp(entry[3], timezone.utc).isoformat()
+            for field in _STATIC_PROBE_FIELDS[name]:
+                section, _, key = field.rpartition(".")
+                if key in (info[section] if section else info):
+                    fields[field] = collected_at
+        return fields
+
+    def _parse_gpu_info(self, sections: Dict[str, Tuple[str, int]]) -> list:
+        """解析 GPU 信息"""
+        stdout, returncode = sections["gpu"]
+
+        if returncode != 0 or stdout == "No NVIDIA GPU":
             return []
 
+        # csv 模块在 C 层切分字段并跳过分隔符后的空格；空行得到空列表，被长度检查跳过
         gpus = []
-        for line in stdout.strip().split("\n"):
-            if line.strip():
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) >= 8:
-                    gpus.append({
-                        "index": int(parts[0]),
-                        "name": parts[1],
-                        "driver_version": parts[2],
-                        "memory_total_mb": int(float(parts[3])),
-                        "memory_free_mb": int(float(parts[4])),
-                        "memory_used_mb": int(float(parts[5])),
-                        "temperature_c": int(float(parts[6])) if parts[6] != "N/A" else None,
-                        "utilization_percent": int(float(parts[7])) if parts[7] != "N/A" else None,
-                    })
+        for row in csv.reader(stdout.splitlines(), skipinitialspace=True):
+            if len(row) < 8:
+                continue
+            index, name, driver, total, free, used, temperature, utilization = (
+                field.strip() for field in row[:8]
+            )
+            gpus.append({
+                "index": int(index),
+                "name": name,
+                "driver_version": driver,
+                "memory_total_mb": int(float(total)),
+                "memory_free_mb": int(float(free)),
+                "memory_used_mb": int(float(used)),
+                "temperature_c": _metric(temperature),
+                "utilization_percent": _metric(utilization),
+            })
         return gpus
 
-    async def _collect_cpu_info(self, ssh: SSHClient) -> Dict[str, Any]:
-        """收集 CPU 信息"""
-        # CPU 核心数
-        cmd_cores = "nproc"
-        stdout, _, _ = await ssh.execute(cmd_cores)
-        cpu_cores = int(stdout.strip()) if stdout.strip().isdigit() else 0
+    def _parse_cpu_info(self, sections: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+        """解析 CPU 信息"""
+        # 同名字段只取第一次出现的值（多簇 ARM 会输出多个 Model name）
+        fields: Dict[str, str] = {}
+        for field, value in _LSCPU_FIELD_PATTERN.findall(sections["cpu"][0]):
+            fields.setdefault(field, value)
 
-        # CPU 型号
-        cmd_model = "lscpu | grep 'Model name' | cut -d':' -f2 | xargs"
-        stdout, _, _ = await ssh.execute(cmd_model)
-        cpu_model = stdout.strip() or "Unknown"
-
-        # CPU 架构
-        cmd_arch = "uname -m"
-        stdout, _, _ = await ssh.execute(cmd_arch)
-        cpu_arch = stdout.strip() or "Unknown"
+        # CPU 核心数（逻辑 CPU 数）、型号、架构
+        cpus = fields.get("CPU(s)", "")
+        cpu_cores = int(cpus) if cpus.isdigit() else 0
+        cpu_model = fields.get("Model name") or "Unknown"
+        cpu_arch = fields.get("Architecture") or "Unknown"
 
         return {
             "cpu_cores": cpu_cores,
@@ -199,68 +499,31 @@ class HardwareInfoExecutor(BaseExecutor):
             "cpu_arch": cpu_arch,
         }
 
-    async def _collect_memory_info(self, ssh: SSHClient) -> Dict[str, Any]:
-        """收集内存信息（包括使用情况和硬件详情）"""
+    def _parse_memory_info(self, sections: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+        """解析内存信息（包括使用情况和硬件详情）"""
         memory_info = {}
 
-        # 1. 收集内存使用情况
-        cmd = "free -m | grep Mem"
-        stdout, _, returncode = await ssh.execute(cmd)
-
-        if returncode == 0:
-            parts = stdout.strip().split()
-            if len(parts) >= 7:
-                memory_info.update({
-                    "memory_total_gb": round(int(parts[1]) / 1024, 2),
-                    "memory_used_gb": round(int(parts[2]) / 1024, 2),
-                    "memory_free_gb": round(int(parts[3]) / 1024, 2),
-                    "memory_available_gb": round(int(parts[6]) / 1024, 2),
-                })
-
-        # 2. 收集内存硬件详情（使用 dmidecode）
-        # 需要 root 权限，如果失败则跳过
-        cmd_dimm = "sudo dmidecode -t memory 2>/dev/null || dmidecode -t memory 2>/dev/null"
-        stdout, _, returncode = await ssh.execute(cmd_dimm)
+        # 1. 内存使用情况
+        stdout, returncode = sections["memory"]
+
+        match = _FREE_MEM_PATTERN.search(stdout) if returncode == 0 else None
+        if match:
+            memory_info.update({
+                "memory_total_gb": round(int(match["total"]) / 1024, 2),
+                "memory_used_gb": round(int(match["used"]) / 1024, 2),
+                "memory_free_gb": round(int(match["free"]) / 1024, 2),
+                "memory_available_gb": round(int(match["available"]) / 1024, 2),
+            })
+
+        # 2. 内存硬件详情（dmidecode 需要 root 权限，失败时跳过）
+        stdout, returncode = sections["dimm"]
 
         memory_devices = []
         if returncode == 0 and stdout:
-            # 解析 dmidecode 输出
-            current_device = {}
-            for line in stdout.split('\n'):
-                line = line.strip()
-
-                # 新的内存设备条目
-                if line.startswith('Memory Device'):
-                    if current_device and current_device.get('size') and current_device.get('size') != 'No Module Installed':
-                        memory_devices.append(current_device)
-                    current_device = {}
-
-                # 解析各个字段
-                elif ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    if key == 'Size':
-                        current_device['size'] = value
-                    elif key == 'Type':
-                        current_device['type'] = value
-                    elif key == 'Speed':
-                        current_device['speed'] = value
-                    elif key == 'Configured Memory Speed':
-                        current_device['configured_speed'] = value
-                    elif key == 'Manufacturer':
-                        current_device['manufacturer'] = value
-                    elif key == 'Part Number':
-                        current_device['part_number'] = value
-                    elif key == 'Locator':
-                        current_device['locator'] = value
-                    elif key == 'Form Factor':
-                        current_device['form_factor'] = value
-
-            # 添加最后一个设备
-            if current_device and current_device.get('size') and current_device.get('size') != 'No Module Installed':
-                memory_devices.append(current_device)
+            for device in self._parse_dimm_devices(stdout):
+                # 跳过空插槽
+                if device.get('size') and device['size'] != 'No Module Installed':
+                    memory_devices.append(device)
 
         # 3. 汇总内存硬件信息
         if memory_devices:
@@ -270,17 +533,9 @@ class HardwareInfoExecutor(BaseExecutor):
             # 计算总容量（从硬件信息）
             total_hardware_gb = 0
             for device in memory_devices:
-                size_str = device.get('size', '')
-                if 'GB' in size_str:
-                    try:
-                        total_hardware_gb += int(size_str.split()[0])
-                    except:
-                        pass
-                elif 'MB' in size_str:
-                    try:
-                        total_hardware_gb += int(size_str.split()[0]) / 1024
-                    except:
-                        pass
+                match = _DIMM_SIZE_PATTERN.search(device.get('size', ''))
+                if match:
+                    total_hardware_gb += int(match.group(1)) * _DIMM_SIZE_UNITS_GB[match.group(2)]
 
             if total_hardware_gb > 0:
                 memory_info['memory_hardware_total_gb'] = round(total_hardware_gb, 2)
@@ -294,17 +549,47 @@ class HardwareInfoExecutor(BaseExecutor):
 
         return memory_info if memory_info else {"memory_total_gb": 0, "memory_free_gb": 0, "memory_used_gb": 0}
 
-    async def _collect_disk_info(self, ssh: SSHClient) -> list:
-        """收集磁盘信息"""
-        cmd = "df -h | grep '^/dev'"
-        stdout, _, returncode = await ssh.execute(cmd)
-
-        if returncode != 0:
-            return []
+    @staticmethod
+    def _parse_dimm_devices(stdout: str) -> list:
+        """解析 dmidecode -t memory 输出中的内存设备条目
 
+        优先按 jc --dmidecode 的 JSON 输出解析；不是 JSON（远程未安装 jc）时，
+        用正则逐个 "Memory Device" 条目提取字段。
+        """
+        if stdout.startswith("["):
+            try:
+                entries = json.loads(stdout)
+            except ValueError:
+                pass
+            else:
+                return [
+                    {
+                        _DIMM_JC_FIELDS[key]: str(value or "").strip()
+                        for key, value in entry.get("values", {}).items()
+                        if key in _DIMM_JC_FIELDS
+                    }
+                    for entry in entries
+                    if entry.get("description") == "Memory Device"
+                ]
+
+        return [
+            {
+                _DIMM_FIELDS[key]: value.strip()
+                for key, value in _DMI_FIELD_PATTERN.findall(block.group(1))
+            }
+            for block in _DMI_DEVICE_PATTERN.finditer(stdout)
+        ]
+
+    def _parse_disk_info(self, sections: Dict[str, Tuple[str, int]]) -> list:
+        """解析磁盘信息"""
+        # 任一挂载点不可读（失效的 NFS、fuse、gvfs 等）时 df 以 1 退出，但其余行仍然完整输出，
+        # 因此不看退出码，直接解析已输出的行
+        stdout, _ = sections["disk"]
+
+        # 只保留 /dev 开头的块设备行（跳过表头和 tmpfs、overlay 等）
         disks = []
-        for line in stdout.strip().split("\n"):
-            if line.strip():
+        for line in stdout.split("\n"):
+            if line.startswith("/dev"):
                 parts = line.split()
                 if len(parts) >= 6:
                     disks.append({
@@ -317,61 +602,52 @@ class HardwareInfoExecutor(BaseExecutor):
                     })
         return disks
 
-    async def _collect_os_info(self, ssh: SSHClient) -> Dict[str, Any]:
-        """收集操作系统信息"""
-        # OS 发行版
-        cmd_os = "cat /etc/os-release | grep '^PRETTY_NAME=' | cut -d'=' -f2 | tr -d '\"'"
-        stdout, _, _ = await ssh.execute(cmd_os)
-        os_name = stdout.strip() or "Unknown"
-
-        # 内核版本
-        cmd_kernel = "uname -r"
-        stdout, _, _ = await ssh.execute(cmd_kernel)
-        kernel_version = stdout.strip() or "Unknown"
-
-        # 主机名
-        cmd_hostname = "hostname"
-        stdout, _, _ = await ssh.execute(cmd_hostname)
-        hostname = stdout.strip() or "Unknown"
-
+    def _parse_os_info(self, sections: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+        """解析操作系统信息：发行版（/etc/os-release 的 PRETTY_NAME）、内核版本、主机名"""
+        name = ""
+        for line in sections["os_name"][0].splitlines():
+            if line.startswith("PRETTY_NAME="):
+                name = line.split("=", 1)[1].strip().strip("\"'")
+                break
         return {
-            "name": os_name,
-            "kernel_version": kernel_version,
-            "hostname": hostname,
+            "name": name or "Unknown",
+            "kernel_version": sections["kernel"][0] or "Unknown",
+            "hostname": sections["hostname"][0] or "Unknown",
         }
 
-    async def _collect_network_info(self, ssh: SSHClient) -> Dict[str, Any]:
-        """收集网络信息"""
-        # IP 地址（简化版，只获取主要网卡）
-        cmd = "hostname -I | awk '{print $1}'"
-        stdout, _, _ = await ssh.execute(cmd)
-        primary_ip = stdout.strip() or "Unknown"
-
+    def _parse_network_info(self, sections: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+        """解析网络信息（简化版，只获取主要网卡 IP：hostname -I 输出的第一个地址）"""
+        addresses = sections["primary_ip"][0].split()
         return {
-            "primary_ip": primary_ip,
+            "primary_ip": addresses[0] if addresses else "Unknown",
         }
 
-    async def _save_hardware_info(self, display_id: int, info: Dict[str, Any]) -> Path:
+    async def _save_hardware_info(
+        self, display_id: int, info: Dict[str, Any], collected_at: datetime
+    ) -> Path:
         """保存硬件信息到 JSON 文件
 
         Args:
             display_id: 显示 ID
             info: 硬件信息字典
+            collected_at: 采集时间（带时区）
 
         Returns:
             保存的文件路径
         """
-        # 确保 results 目录存在
-        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-
-        # 生成文件名：hardware_info_{display_id}_{timestamp}.json
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 生成文件名：hardware_info_{display_id}_{timestamp}.json（本地时间）
+        timestamp = collected_at.astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"hardware_info_{display_id}_{timestamp}.json"
         file_path = RESULTS_DIR / filename
 
-        # 保存为格式化的 JSON
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(info, f, indent=2, ensure_ascii=False)
+        def write() -> None:
+            # 确保 results 目录存在（可能在运行期间被清理），再写入格式化的 JSON
+            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "wb") as f:
+                _write_report(f, info)
+
+        # 序列化和文件写入放到线程中执行，不阻塞事件循环上的其他 SSH IO
+        await asyncio.to_thread(write)
 
         self.log_info(f"Hardware info saved to: {file_path}")
         return file_path
@@ -1,12 +1,24 @@
 # executor/logger.py
-import datetime
 import os
+import time
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 
 DEFAULT_BASE_DIR = Path(__file__).resolve().parents[2]
 BASE_DIR = Path(os.getenv("LLM_PERF_BASE_DIR", DEFAULT_BASE_DIR))
 LOG_DIR = Path(os.getenv("LLM_PERF_LOG_DIR", BASE_DIR / "task_logs"))
 
+# Minimum level written to task logs (DEBUG / INFO / ERROR); lower levels are
+# dropped before their message is formatted
+_LEVELS = {"DEBUG": 10, "INFO": 20, "ERROR": 40}
+TASK_LOG_LEVEL = _LEVELS.get(os.getenv("LLM_PERF_TASK_LOG_LEVEL", "DEBUG").upper(), 10)
+
+
+def log_file_path(display_id: int, task_uuid: str) -> Path:
+    """Return the log file path for a task: {display_id}_{uuid}.log"""
+    return LOG_DIR / f"{display_id}_{task_uuid}.log"
+
 
 class TaskLogger:
     def __init__(self, task_uuid: str, display_id: int):
@@ -22,25 +34,66 @@ class TaskLogger:
 
         # Filename format: {display_id}_{uuid}.log
         # Example: 1_550e8400-e29b-41d4-a716-446655440000.log
-        self.file_path = LOG_DIR / f"{display_id}_{task_uuid}.log"
+        self.file_path = log_file_path(display_id, task_uuid)
 
         # Delete existing log file to prevent appending to old logs
         # This ensures each task starts with a clean log file
-        if self.file_path.exists():
-            self.file_path.unlink()
+        # (unlink with missing_ok avoids a separate exists() stat)
+        self.file_path.unlink(missing_ok=True)
+
+        # Opened on the first record and kept for the logger's lifetime
+        self._handle = None
+        # Inside batch(): records are buffered and flushed once when it exits
+        self._batching = False
+
+    def _write(self, level: str, msg: str, args: tuple) -> None:
+        if _LEVELS[level] < TASK_LOG_LEVEL:
+            return
+        # %-style args are only formatted once the message is actually written
+        if args:
+            msg = msg % args
+        # time.strftime formats the local time directly, without building a datetime
+        line = "[%s][%s] %s\n" % (time.strftime("%Y-%m-%d %H:%M:%S"), level, msg)
+        handle = self._handle
+        if handle is None:
+            handle = self._open()
+        handle.write(line)
+        # Flush per record so the log stays readable while the task is running
+        if not self._batching:
+            handle.flush()
+
+    def _open(self):
+        self._handle = self.file_path.open("a", encoding="utf-8")
+        # Close the handle once the logger is garbage collected
+        weakref.finalize(self, self._handle.close)
+        return self._handle
+
+    def close(self) -> None:
+        """Flush and close the log file; a later record reopens it"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
 
-    def _write(self, level: str, msg: str) -> None:
-        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{ts}][{level}] {msg}\n"
-        with self.file_path.open("a", encoding="utf-8") as handle:
-            handle.write(line)
+    @contextmanager
+    def batch(self):
+        """Buffer consecutive records and flush them to the file once at the end"""
+        if self._batching:
+            yield self
+            return
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            if self._handle is not None:
+                self._handle.flush()
 
-    def info(self, msg: str) -> None:
-        self._write("INFO", msg)
+    def info(self, msg: str, *args) -> None:
+        self._write("INFO", msg, args)
 
-    def error(self, msg: str) -> None:
-        self._write("ERROR", msg)
+    def error(self, msg: str, *args) -> None:
+        self._write("ERROR", msg, args)
 
-    def debug(self, msg: str) -> None:
-        self._write("DEBUG", msg)
+    def debug(self, msg: str, *args) -> None:
+        self._write("DEBUG", msg, args)
 
@@ -1,5 +1,6 @@
 """远程模型扫描器 - 扫描远程服务器上的可用模型"""
 import logging
+import shlex
 from typing import List, Dict, Optional
 from pathlib import Path
 import os
@@ -103,14 +104,6 @@ class ModelScanner:
 
         try:
             async with self.ssh_client:
-                # 检查目录是否存在
-                check_cmd = f"test -d '{base_dir}' && echo 'exists' || echo 'not_found'"
-                stdout, stderr, returncode = await self.ssh_client.execute(check_cmd)
-
-                if stdout.strip() != "exists":
-                    logger.warning(f"Directory {base_dir} does not exist on remote server")
-                    return []
-
                 # 获取目录列表（只包含目录，不包含文件）
                 # 使用 ls -d */ 只列出目录
                 # 排除非模型目录：AMES、perftest、output 等
@@ -118,32 +111,38 @@ class ModelScanner:
                 if not include_hidden:
                     exclude_pattern += "|\\..*"  # 排除隐藏目录
 
-                ls_cmd = f"cd '{base_dir}' && ls -d */ 2>/dev/null | sed 's|/$||' | egrep -v '{exclude_pattern}'"
-
+                # 目录检查与列目录合并为一次 SSH 命令：第一行输出 exists/not_found，其后每行一个目录名
+                # egrep -v 如果没有匹配项会返回非0，这是正常的，因此不检查返回码
+                ls_cmd = (
+                    f"if [ -d '{base_dir}' ]; then echo exists; "
+                    f"cd '{base_dir}' && ls -d */ 2>/dev/null | sed 's|/$||' | egrep -v '{exclude_pattern}'; "
+                    f"else echo not_found; fi"
+                )
                 stdout, stderr, returncode = await self.ssh_client.execute(ls_cmd)
 
-                # egrep -v 如果没有匹配项会返回非0，这是正常的
-                if returncode != 0 and not stdout.strip():
-                    logger.info(f"No model directories found in {base_dir} after filtering")
+                status, _, listing = stdout.strip().partition("\n")
+                if status != "exists":
+                    logger.warning(f"Directory {base_dir} does not exist on remote server")
                     return []
 
                 # 解析目录列表
-                dir_names = [line.strip() for line in stdout.split("\n") if line.strip()]
+                dir_names = [line.strip() for line in listing.split("\n") if line.strip()]
 
                 if not dir_names:
-                    logger.info(f"No directories found in {base_dir}")
+                    logger.info(f"No model directories found in {base_dir} after filtering")
                     return []
 
                 logger.info(f"Found {len(dir_names)} model directories")
                 logger.info(f"Directories: {dir_names}")
 
+                # 一次 du 命令获取所有目录大小，避免每个目录一次 SSH 往返
+                sizes = await self._get_directory_sizes_gb(base_dir, dir_names)
+
                 # 构建模型信息列表
                 models = []
                 for dir_name in dir_names:
                     model_path = f"{base_dir}/{dir_name}"
-
-                    # 获取目录大小 (以GB为单位)
-                    size_gb = await self._get_directory_size_gb(model_path)
+                    size_gb = sizes.get(dir_name)
 
                     # 获取模型family和type（如果appauto可用）
                     family, model_type = self._get_model_info(dir_name)
@@ -192,31 +191,37 @@ class ModelScanner:
             logger.debug(f"Failed to get model info for {model_name}: {e}")
             return None, None
 
-    async def _get_directory_size_gb(self, directory: str) -> Optional[float]:
-        """获取目录大小（GB）
+    async def _get_directory_sizes_gb(self, base_dir: str, dir_names: List[str]) -> Dict[str, float]:
+        """用一次远程命令获取 base_dir 下多个目录的大小（GB）
 
         Args:
-            directory: 目录路径
+            base_dir: 基础目录路径
+            dir_names: 目录名列表
 
         Returns:
-            目录大小（GB），如果获取失败返回None
+            目录名 -> 大小（GB）；获取失败的目录不在结果中
         """
         try:
             # 使用 du 命令获取目录大小
             # -s: 只显示总计
             # -b: 以字节为单位
-            cmd = f"du -sb '{directory}' 2>/dev/null | cut -f1"
-            stdout, stderr, returncode = await self.ssh_client.execute(cmd, timeout=60)
-
-            if returncode == 0 and stdout:
-                bytes_size = int(stdout.strip())
-                gb_size = bytes_size / (1024 ** 3)  # 转换为GB
-                return round(gb_size, 2)
-            else:
-                return None
+            # 每个目录单独执行一次 du（在同一条远程命令中循环）：一次 du 多个目录时，目录间共享的
+            # 硬链接文件只计入第一个目录；-l 又会让同一目录内的硬链接重复计数，两者都与逐个目录统计不同
+            # 输出每行 "<字节数>\t<目录名>"；单个目录失败不影响其他目录
+            names = " ".join(shlex.quote(name) for name in dir_names)
+            cmd = f"cd '{base_dir}' && for d in {names}; do du -sb -- \"$d\" 2>/dev/null; done"
+            # 每个目录保留原先单独执行时的 60 秒超时预算
+            stdout, stderr, returncode = await self.ssh_client.execute(cmd, timeout=60 * len(dir_names))
+
+            sizes = {}
+            for line in stdout.splitlines():
+                size, _, name = line.partition("\t")
+                if size.isdigit():
+                    sizes[name] = round(int(size) / (1024 ** 3), 2)  # 转换为GB
+            return sizes
         except Exception as e:
-            logger.warning(f"Failed to get directory size for {directory}: {e}")
-            return None
+            logger.warning(f"Failed to get directory sizes in {base_dir}: {e}")
+            return {}
 
     async def check_model_exists(self, model_path: str) -> bool:
         """检查指定模型路径是否存在
@@ -249,11 +254,21 @@ class ModelScanner:
 
         try:
             async with self.ssh_client:
-                # 检查是否存在且是目录
-                check_cmd = f"test -d '{model_path}' && echo 'dir' || (test -e '{model_path}' && echo 'file' || echo 'not_found')"
-                stdout, stderr, returncode = await self.ssh_client.execute(check_cmd)
+                # 一次 SSH 命令完成全部检查，每项输出一行：
+                # 路径类型（dir/file/not_found）；是目录时再输出目录字节数、config.json、tokenizer 文件检查结果
+                check_cmd = (
+                    f"p='{model_path}'; "
+                    'if [ -d "$p" ]; then echo dir; '
+                    'echo "$(du -sb "$p" 2>/dev/null | cut -f1)"; '
+                    'test -f "$p/config.json" && echo exists || echo not_found; '
+                    'test -f "$p/tokenizer.json" -o -f "$p/tokenizer_config.json" && echo exists || echo not_found; '
+                    'elif [ -e "$p" ]; then echo file; '
+                    'else echo not_found; fi'
+                )
+                stdout, stderr, returncode = await self.ssh_client.execute(check_cmd, timeout=60)
 
-                status = stdout.strip()
+                lines = stdout.split("\n")
+                status = lines[0].strip()
                 if status == "not_found":
                     return ModelValidationResult(
                         exists=False,
@@ -276,19 +291,12 @@ class ModelScanner:
                         has_tokenizer=False,
                     )
 
-                # 获取目录大小
-                size_gb = await self._get_directory_size_gb(model_path)
-
-                # 检查关键文件
-                # config.json
-                config_cmd = f"test -f '{model_path}/config.json' && echo 'exists' || echo 'not_found'"
-                stdout, _, _ = await self.ssh_client.execute(config_cmd)
-                has_config = (stdout.strip() == "exists")
-
-                # tokenizer相关文件 (tokenizer.json 或 tokenizer_config.json)
-                tokenizer_cmd = f"test -f '{model_path}/tokenizer.json' -o -f '{model_path}/tokenizer_config.json' && echo 'exists' || echo 'not_found'"
-                stdout, _, _ = await self.ssh_client.execute(tokenizer_cmd)
-                has_tokenizer = (stdout.strip() == "exists")
+                # 目录大小、关键文件（config.json；tokenizer.json 或 tokenizer_config.json）
+                lines += [""] * (4 - len(lines))
+                size = lines[1].strip()
+                size_gb = round(int(size) / (1024 ** 3), 2) if size.isdigit() else None  # 转换为GB
+                has_config = (lines[2].strip() == "exists")
+                has_tokenizer = (lines[3].strip() == "exists")
 
                 return ModelValidationResult(
                     exists=exists,
@@ -1,7 +1,11 @@
 import asyncio
 import logging
+import socket
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Awaitable, Dict, Optional, Tuple, TypeVar
+from weakref import WeakSet
 
 import asyncssh
 from asyncssh import SSHClientConnection
@@ -9,6 +13,109 @@ from asyncssh import SSHClientConnection
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Python 3.11+ 的 asyncio.timeout 直接在当前任务上设置超时，不像 wait_for 那样额外包装一个 Task
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+
+async def _with_timeout(awaitable: Awaitable[_T], timeout: Optional[float]) -> _T:
+    """在 timeout 秒内等待 awaitable 完成，超时抛出 asyncio.TimeoutError"""
+    if _HAS_ASYNCIO_TIMEOUT:
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    return await asyncio.wait_for(awaitable, timeout=timeout)
+
+
+# 空闲连接池：事件循环 -> {连接参数: (连接, 归还时间)}。asyncssh 连接绑定创建它的事件循环，因此按循环分别缓存。
+# 只有通过 enable_connection_pool 登记的常驻事件循环（API 服务的循环）才缓存空闲连接：
+# 调度线程的事件循环只在 run_sync 期间运行，空闲时既不会触发超时回收，也无法响应服务端的 keepalive。
+# 连接本身引用所属循环，不能用 WeakKeyDictionary，改为在访问时清理已关闭循环的条目
+_POOL_IDLE_TIMEOUT = 600.0
+_pool_lock = threading.Lock()
+_pool: Dict[asyncio.AbstractEventLoop, Dict[tuple, Tuple[SSHClientConnection, float]]] = {}
+_pool_loops: "WeakSet[asyncio.AbstractEventLoop]" = WeakSet()
+
+
+def enable_connection_pool() -> None:
+    """允许当前事件循环缓存空闲连接，只应在持续运行的事件循环中调用（如 API 服务启动时）"""
+    with _pool_lock:
+        _pool_loops.add(asyncio.get_running_loop())
+
+
+async def close_connection_pool() -> None:
+    """关闭当前事件循环缓存的全部空闲连接并停止缓存，在事件循环停止前调用"""
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        _pool_loops.discard(loop)
+        conns = [conn for conn, _ in _pool.pop(loop, {}).values()]
+    for conn in conns:
+        conn.close()
+    await asyncio.gather(*(conn.wait_closed() for conn in conns), return_exceptions=True)
+
+
+def _shutdown_orphaned(conn: SSHClientConnection) -> None:
+    """所属事件循环已关闭的连接无法再 close()，直接关闭底层套接字的收发，让远端断开连接"""
+    sock = conn.get_extra_info("socket")
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _reap_idle(idle: Dict[tuple, Tuple[SSHClientConnection, float]], now: float) -> None:
+    """关闭当前循环中空闲超时或已断开的连接，并清理已关闭循环的连接池（调用方需持有 _pool_lock）"""
+    for loop in [loop for loop in _pool if loop.is_closed()]:
+        for conn, _ in _pool.pop(loop).values():
+            _shutdown_orphaned(conn)
+    for key, (conn, released_at) in list(idle.items()):
+        if conn.is_closed() or now - released_at > _POOL_IDLE_TIMEOUT:
+            del idle[key]
+            conn.close()
+
+
+def _borrow(key: tuple) -> Optional[SSHClientConnection]:
+    """取出当前事件循环中该连接参数对应的空闲连接，没有时返回 None"""
+    now = time.monotonic()
+    with _pool_lock:
+        idle = _pool.get(asyncio.get_running_loop())
+        if not idle:
+            return None
+        _reap_idle(idle, now)
+        entry = idle.pop(key, None)
+    return entry[0] if entry else None
+
+
+def _release(key: tuple, conn: SSHClientConnection) -> None:
+    """将连接放回当前事件循环的连接池；同参数已有空闲连接、或当前循环未启用连接池时直接关闭
+
+    同时在该循环上安排一次超时回收，循环之后不再使用连接池时，空闲连接也会按时关闭。
+    """
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+    with _pool_lock:
+        if loop not in _pool_loops:
+            conn.close()
+            return
+        idle = _pool.setdefault(loop, {})
+        _reap_idle(idle, now)
+        if key in idle or conn.is_closed():
+            conn.close()
+            return
+        idle[key] = (conn, now)
+    loop.call_later(_POOL_IDLE_TIMEOUT, _expire, loop, key, (conn, now))
+
+
+def _expire(loop: asyncio.AbstractEventLoop, key: tuple, entry: Tuple[SSHClientConnection, float]) -> None:
+    """空闲超时回调：连接仍是那次归还后未被取走的空闲连接时关闭它"""
+    with _pool_lock:
+        idle = _pool.get(loop)
+        if idle is None or idle.get(key) != entry:
+            return
+        del idle[key]
+    entry[0].close()
+
 
 class SSHClient:
     def __init__(self, config: Dict):
@@ -21,8 +128,24 @@ class SSHClient:
         self.passphrase = config.get("passphrase")
         self.timeout = config.get("timeout", 30)
         self.conn: Optional[SSHClientConnection] = None
+        # 当前连接是否取自连接池且尚未成功执行过命令（可能已被服务端或 NAT 断开）
+        self._reused = False
+        # 认证参数也计入连接池键，避免不同凭据复用同一条已认证的连接
+        self._pool_key = (
+            self.host, self.port, self.user, self.auth_type,
+            self.password, self.private_key_path, self.passphrase,
+        )
 
     async def connect(self) -> None:
+        self.conn = _borrow(self._pool_key)
+        self._reused = self.conn is not None
+        if self._reused:
+            logger.info(f"Reusing connection to {self.user}@{self.host}:{self.port}")
+            return
+        await self._open()
+
+    async def _open(self) -> None:
+        """建立一条新连接（不经过连接池）"""
         logger.info(f"Connecting to {self.user}@{self.host}:{self.port}")
 
         connect_kwargs = {
@@ -56,6 +179,13 @@ class SSHClient:
             self.conn.close()
             await self.conn.wait_closed()
             logger.info(f"Disconnected from {self.host}")
+            self.conn = None
+
+    def release(self) -> None:
+        """归还连接供同一事件循环中的后续 SSHClient 复用，空闲超过 _POOL_IDLE_TIMEOUT 后关闭"""
+        if self.conn:
+            _release(self._pool_key, self.conn)
+            self.conn = None
 
     async def execute(self, command: str, timeout: Optional[int] = None) -> Tuple[str, str, int]:
         if not self.conn:
@@ -65,10 +195,21 @@ class SSHClient:
         logger.info(f"Executing command: {command}")
 
         try:
-            result = await asyncio.wait_for(
-                self.conn.run(command, check=False),
-                timeout=timeout
-            )
+            try:
+                result = await _with_timeout(self.conn.run(command, check=False), timeout)
+            except asyncio.TimeoutError:
+                raise
+            except (asyncssh.Error, OSError) as e:
+                if not self._reused:
+                    raise
+                # 复用的空闲连接可能已被服务端或 NAT 断开，换一条新连接重试一次
+                logger.warning(f"Pooled connection to {self.host} failed ({e}), reconnecting")
+                self.conn.close()
+                self.conn = None
+                self._reused = False
+                await self._open()
+                result = await _with_timeout(self.conn.run(command, check=False), timeout)
+            self._reused = False
 
             stdout = result.stdout.strip() if result.stdout else ""
             stderr = result.stderr.strip() if result.stderr else ""
@@ -103,9 +244,9 @@ class SSHClient:
                 stdout_task = asyncio.create_task(read_stream(process.stdout, "stdout"))
                 stderr_task = asyncio.create_task(read_stream(process.stderr, "stderr"))
 
-                await asyncio.wait_for(
+                await _with_timeout(
                     asyncio.gather(stdout_task, stderr_task, process.wait()),
-                    timeout=timeout
+                    timeout,
                 )
 
                 return process.returncode
@@ -183,4 +324,8 @@ class SSHClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.disconnect()
+        # 正常退出时归还连接；出错时连接状态未知，直接断开
+        if exc_type is None:
+            self.release()
+        else:
+            await self.disconnect()
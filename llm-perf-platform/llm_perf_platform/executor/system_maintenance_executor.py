@@ -4,11 +4,17 @@
 """
 import os
 import asyncio
+import shlex
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
 
 from llm_perf_platform.executor.base_executor import BaseExecutor, ExecutionResult
+from llm_perf_platform.executor.command_executor import (
+    STREAM_LIMIT,
+    OutputBuffer,
+    wait_process,
+)
 
 
 class SystemMaintenanceExecutor(BaseExecutor):
@@ -260,28 +266,33 @@ class SystemMaintenanceExecutor(BaseExecutor):
         Returns:
             tuple[bool, str, str]: (成功标志, stdout, stderr)
         """
+        # 逐行读取输出，只保留开头和末尾若干行（pip/uv 安装输出可能很长，且会写入任务摘要）
+        stdout_buffer = OutputBuffer()
+        stderr_buffer = OutputBuffer()
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=cwd
+                cwd=cwd,
+                limit=STREAM_LIMIT,
             )
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
+            try:
+                await wait_process(process, timeout, stdout_buffer, stderr_buffer)
+            except asyncio.TimeoutError:
+                # 超时后结束子进程，避免其在后台继续运行
+                process.kill()
+                await process.wait()
+                self.log_error("命令执行超时: %s", shlex.join(cmd))
+                return False, stdout_buffer.getvalue().decode("utf-8", errors="replace"), "命令执行超时"
 
             success = process.returncode == 0
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
+            stdout_str = stdout_buffer.getvalue().decode("utf-8", errors="replace")
+            stderr_str = stderr_buffer.getvalue().decode("utf-8", errors="replace")
 
             return success, stdout_str, stderr_str
 
-        except asyncio.TimeoutError:
-            self.log_error(f"命令执行超时: {' '.join(cmd)}")
-            return False, "", "命令执行超时"
         except Exception as e:
             self.log_error(f"命令执行失败: {str(e)}")
             return False, "", str(e)
@@ -17,12 +17,14 @@ import asyncio
 import logging
 import sys
 import subprocess
+import traceback
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 from llm_perf_platform.executor.base_executor import (
     BaseExecutor,
     ExecutionResult,
+    run_sync,
 )
 from llm_perf_platform.services.venv_manager import get_venv_manager
 
@@ -262,7 +264,6 @@ class TestExecutor(BaseExecutor):
                 self.log_info("Model launched successfully, waiting for it to be ready...")
 
                 # 等待一段时间确保模型完全就绪
-                import asyncio
                 await asyncio.sleep(5)
 
                 # 验证模型已启动
@@ -385,7 +386,6 @@ class TestExecutor(BaseExecutor):
                 self.log_info("Model launched successfully")
 
                 # 等待一段时间确保模型完全就绪
-                import asyncio
                 await asyncio.sleep(5)
 
             # 初始化 AMaaSNodeCli（用于性能测试）
@@ -449,7 +449,6 @@ class TestExecutor(BaseExecutor):
             )
 
         except Exception as e:
-            import traceback
             self.log_error(f"AMaaS test execution failed: {e}")
             self.log_error(f"Traceback: {traceback.format_exc()}")
 
@@ -477,13 +476,6 @@ def run_test_sync(task_payload: Dict[str, Any]) -> Dict[str, Any]:
     appauto_branch = task_payload.get("appauto_branch", "main")
     executor = TestExecutor(task_id, appauto_branch=appauto_branch)
 
-    # 在新的事件循环中执行异步测试
-    loop_obj = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop_obj)
-
-    try:
-        result = loop_obj.run_until_complete(executor.execute(task_payload))
-        # 转换为向后兼容的字典格式
-        return result.to_dict()
-    finally:
-        loop_obj.close()
+    # 在当前线程的常驻事件循环中执行异步测试，转换为向后兼容的字典格式
+    result = run_sync(executor.execute(task_payload))
+    return result.to_dict()
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from llm_perf_platform.api.router import router as api_router
+from llm_perf_platform.executor.ssh_client import close_connection_pool, enable_connection_pool
 from llm_perf_platform.models.db import init_db
 from llm_perf_platform.tasks.scheduler import task_scheduler
 from llm_perf_platform.services.health_checker import (
@@ -74,6 +75,8 @@ def create_app() -> FastAPI:
         auth_service.ensure_default_admin()
 
         task_scheduler.start()
+        # API 服务的事件循环持续运行，模型扫描等请求可以复用空闲的 SSH 连接
+        enable_connection_pool()
         # 启动健康检查服务 (60秒间隔, 30秒启动延迟)
         await start_health_check_service(check_interval=60, startup_delay=30)
 
@@ -83,6 +86,7 @@ def create_app() -> FastAPI:
         task_scheduler.shutdown()
         # 停止健康检查服务
         await stop_health_check_service()
+        await close_connection_pool()
 
     app.include_router(api_router, prefix="/api")
 
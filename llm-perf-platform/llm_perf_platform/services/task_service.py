@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import base64
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import and_, func, insert, or_, update
 from sqlmodel import select
 
 from llm_perf_platform.models.db import get_session
@@ -18,6 +23,38 @@ def session_scope():
         session.close()
 
 
+# 分页总数缓存的有效期（秒）
+COUNT_CACHE_TTL = 30.0
+
+_count_cache: Dict[Tuple[Optional[int], Optional[str]], Tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+def _invalidate_count_cache() -> None:
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+def encode_cursor(record: TaskRecord) -> str:
+    """将 (created_at, id) 编码为不透明的游标字符串"""
+    raw = f"{record.created_at.isoformat()}|{record.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """解析游标字符串
+
+    Raises:
+        ValueError: 游标格式非法
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, task_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except Exception as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+
 class TaskService:
     """Encapsulates CRUD operations for TaskRecord objects."""
 
@@ -70,9 +107,48 @@ class TaskService:
             session.commit()
             session.refresh(record)
 
-            return record
+        _invalidate_count_cache()
+        return record
     
 
+    def create_tasks(self, specs: List[Dict[str, Any]]) -> List[TaskRecord]:
+        """批量创建任务记录（单个事务）
+
+        Args:
+            specs: 每项为 create_task 的关键字参数字典
+
+        Returns:
+            List[TaskRecord]: 创建的任务记录，顺序与 specs 一致
+        """
+        if not specs:
+            return []
+
+        # uuid、created_at 等默认值在 Python 侧生成，先构造模型再导出为行字典
+        records = [TaskRecord(**{"status": "queued", **spec}) for spec in specs]
+        rows = [record.model_dump(exclude={"id", "display_id"}) for record in records]
+
+        with session_scope() as session:
+            connection = session.connection()
+            # 单条多行 INSERT ... RETURNING，按参数顺序返回自增 ID
+            ids = connection.execute(
+                insert(TaskRecord).returning(TaskRecord.id, sort_by_parameter_order=True),
+                rows,
+            ).scalars().all()
+            # display_id 与 ID 相同，一条 UPDATE 批量回填
+            connection.execute(
+                update(TaskRecord)
+                .where(TaskRecord.id.in_(ids))
+                .values(display_id=TaskRecord.id)
+            )
+            session.commit()
+
+        for record, task_id in zip(records, ids):
+            record.id = task_id
+            record.display_id = task_id
+
+        _invalidate_count_cache()
+        return records
+
     def mark_running(self, task_id: int) -> None:
         """标记任务为运行中状态
 
@@ -210,14 +286,7 @@ class TaskService:
             if task_type is not None:
                 statement = statement.where(TaskRecord.task_type == task_type)
 
-            # 获取总数
-            from sqlalchemy import func
-            count_statement = select(func.count()).select_from(TaskRecord)
-            if user_id is not None:
-                count_statement = count_statement.where(TaskRecord.user_id == user_id)
-            if task_type is not None:
-                count_statement = count_statement.where(TaskRecord.task_type == task_type)
-            total = session.exec(count_statement).one()
+            total = self.count_tasks(user_id=user_id, task_type=task_type)
 
             # 应用分页和排序
             offset = (page - 1) * page_size
@@ -231,6 +300,90 @@ class TaskService:
             tasks = list(session.exec(statement))
             return tasks, total
 
+    def list_tasks_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        user_id: Optional[int] = None,
+        task_type: Optional[str] = None,
+    ) -> tuple[List[TaskRecord], Optional[str]]:
+        """基于游标获取任务列表（无需 COUNT）
+
+        按 (created_at, id) 倒序做范围扫描，多取一行用于判断是否还有下一页。
+
+        Args:
+            cursor: 上一页返回的 next_cursor，为空时从最新任务开始
+            page_size: 每页大小，默认20
+            user_id: 用户ID过滤（可选）
+            task_type: 任务类型过滤（可选）
+
+        Returns:
+            tuple[List[TaskRecord], Optional[str]]: (任务列表, 下一页游标；无更多数据时为 None)
+
+        Raises:
+            ValueError: 游标格式非法
+        """
+        with session_scope() as session:
+            statement = select(TaskRecord)
+            if user_id is not None:
+                statement = statement.where(TaskRecord.user_id == user_id)
+            if task_type is not None:
+                statement = statement.where(TaskRecord.task_type == task_type)
+            if cursor:
+                created_at, last_id = decode_cursor(cursor)
+                statement = statement.where(
+                    or_(
+                        TaskRecord.created_at < created_at,
+                        and_(TaskRecord.created_at == created_at, TaskRecord.id < last_id),
+                    )
+                )
+
+            statement = (
+                statement
+                .order_by(TaskRecord.created_at.desc(), TaskRecord.id.desc())
+                .limit(page_size + 1)
+            )
+
+            tasks = list(session.exec(statement))
+            next_cursor = None
+            if len(tasks) > page_size:
+                tasks = tasks[:page_size]
+                next_cursor = encode_cursor(tasks[-1])
+            return tasks, next_cursor
+
+    def count_tasks(
+        self,
+        user_id: Optional[int] = None,
+        task_type: Optional[str] = None,
+    ) -> int:
+        """统计任务总数（结果缓存 COUNT_CACHE_TTL 秒，任务增删时失效）
+
+        Args:
+            user_id: 用户ID过滤（可选）
+            task_type: 任务类型过滤（可选）
+
+        Returns:
+            int: 任务数量
+        """
+        key = (user_id, task_type)
+        now = time.monotonic()
+        with _count_cache_lock:
+            cached = _count_cache.get(key)
+            if cached and now - cached[0] < COUNT_CACHE_TTL:
+                return cached[1]
+
+        with session_scope() as session:
+            statement = select(func.count()).select_from(TaskRecord)
+            if user_id is not None:
+                statement = statement.where(TaskRecord.user_id == user_id)
+            if task_type is not None:
+                statement = statement.where(TaskRecord.task_type == task_type)
+            total = session.exec(statement).one()
+
+        with _count_cache_lock:
+            _count_cache[key] = (now, total)
+        return total
+
     def list_tasks_by_status(self, status: str, limit: int = 100) -> List[TaskRecord]:
         """根据状态获取任务列表
 
@@ -279,7 +432,6 @@ class TaskService:
             int: 任务数量
         """
         with session_scope() as session:
-            from sqlalchemy import func
             statement = select(func.count()).select_from(TaskRecord).where(TaskRecord.status == status)
             return session.exec(statement).one()
 
@@ -295,6 +447,34 @@ class TaskService:
         with session_scope() as session:
             return session.get(TaskRecord, task_id)
 
+    def get_task_view(self, task_id: int, *fields: str) -> Optional[Any]:
+        """只查询任务的部分列，避免 ORM 整行加载
+
+        Args:
+            task_id: 任务ID
+            *fields: 需要的 TaskRecord 列名
+
+        Returns:
+            Optional[Row]: 按 fields 顺序排列的行（支持属性访问），任务不存在时返回 None
+        """
+        columns = [getattr(TaskRecord, field) for field in fields]
+        with session_scope() as session:
+            statement = select(*columns).where(TaskRecord.id == task_id)
+            # 通过 Core 连接执行：session.exec 在单列查询时会返回标量而非 Row
+            return session.connection().execute(statement).one_or_none()
+
+    def get_auth_view(self, task_id: int) -> Optional[Tuple[Optional[int], str]]:
+        """获取权限检查所需的 (user_id, status)
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            Optional[Tuple[Optional[int], str]]: (创建用户ID, 任务状态)，任务不存在时返回 None
+        """
+        row = self.get_task_view(task_id, "user_id", "status")
+        return tuple(row) if row is not None else None
+
     def delete_task(self, task_id: int) -> Optional[TaskRecord]:
         """删除任务记录
 
@@ -310,7 +490,9 @@ class TaskService:
                 return None
             session.delete(record)
             session.commit()
-            return record
+
+        _invalidate_count_cache()
+        return record
 
     def _update_task(
         self,
@@ -333,8 +515,6 @@ class TaskService:
             for key, value in values.items():
                 setattr(record, key, value)
             if set_completed:
-                from datetime import datetime
-
                 record.completed_at = datetime.now()
                 if values.get("status") == "completed":
                     record.error_message = None
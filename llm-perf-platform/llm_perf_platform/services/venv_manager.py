@@ -7,9 +7,10 @@ allowing concurrent tasks to use different versions without conflicts.
 import logging
 import os
 import shutil
+import stat
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,8 @@ class VenvManager:
         self.base_dir = base_dir or VENV_BASE_DIR
         self.appauto_source = appauto_source or APPAUTO_SOURCE_PATH
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # branch -> appauto binary path; paths only depend on base_dir and branch
+        self._bin_paths: Dict[str, Path] = {}
 
     def get_venv_path(self, branch: str) -> Path:
         """Get the venv directory path for a specific branch."""
@@ -43,14 +46,21 @@ class VenvManager:
         return self.base_dir / f"appauto-{safe_branch}"
 
     def get_appauto_bin_path(self, branch: str) -> Path:
-        """Get the appauto binary path for a specific branch."""
-        venv_path = self.get_venv_path(branch)
-        return venv_path / ".venv" / "bin" / "appauto"
+        """Get the appauto binary path for a specific branch (computed once per branch)."""
+        appauto_bin = self._bin_paths.get(branch)
+        if appauto_bin is None:
+            appauto_bin = self.get_venv_path(branch) / ".venv" / "bin" / "appauto"
+            self._bin_paths[branch] = appauto_bin
+        return appauto_bin
 
     def venv_exists(self, branch: str) -> bool:
         """Check if venv exists for a branch."""
-        appauto_bin = self.get_appauto_bin_path(branch)
-        return appauto_bin.exists() and appauto_bin.is_file()
+        # A single stat covers both existence and file type; the result itself is
+        # not cached since venvs can be removed or rebuilt by maintenance tasks
+        try:
+            return stat.S_ISREG(os.stat(self.get_appauto_bin_path(branch)).st_mode)
+        except OSError:
+            return False
 
     def create_venv(self, branch: str) -> bool:
         """
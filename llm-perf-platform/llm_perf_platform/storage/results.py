@@ -35,9 +35,9 @@ class ResultStorage:
         filename = f"task_{task_id}.xlsx"
         file_path = RESULTS_DIR / filename
 
-        wb = Workbook()
-        ws_summary = wb.active
-        ws_summary.title = "summary"
+        # write_only mode streams rows to disk instead of building the full cell model in memory
+        wb = Workbook(write_only=True)
+        ws_summary = wb.create_sheet("summary")
 
         ws_summary.append(["task_id", task_id])
         ws_summary.append(["engine", parameters.get("engine")])
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from llm_perf_platform.executor.base_executor import TaskType
+from llm_perf_platform.executor.base_executor import TASK_TYPES_BY_VALUE, TaskType, run_sync
 from llm_perf_platform.executor.test_executor import run_test_sync
 from llm_perf_platform.executor.command_executor import CommandExecutor
 from llm_perf_platform.services.task_service import TaskService
@@ -32,9 +32,13 @@ class TaskScheduler:
     """
 
     def __init__(self, max_workers: int = 4) -> None:
+        # 单一共享队列的线程池即可：任务全部由 API 线程提交、按提交顺序执行，
+        # 每个任务运行数秒到数小时，队列锁的竞争可以忽略，无需按工作线程拆分队列
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._lock = threading.Lock()
         self._futures: Dict[int, Future] = {}
+        # 正在运行的命令行任务 -> 执行器，用于取消时终止子进程
+        self._running: Dict[int, CommandExecutor] = {}
         self._task_service = TaskService()
         self._result_storage = ResultStorage()
         self._started = False
@@ -47,13 +51,27 @@ class TaskScheduler:
         self._started = False
 
     def submit(self, task_id: int, payload: Dict[str, Any]) -> Future:
+        return self.submit_many([(task_id, payload)])[0]
+
+    def submit_many(self, items: Iterable[Tuple[int, Dict[str, Any]]]) -> List[Future]:
+        """批量提交任务，只获取一次调度器锁登记所有 Future
+
+        Args:
+            items: (task_id, payload) 序列
+
+        Returns:
+            List[Future]: 与 items 顺序一致的 Future 列表
+        """
         if not self._started:
             self.start()
-        future = self._executor.submit(self._run_task, task_id, payload)
+        items = list(items)
+        futures = [self._executor.submit(self._run_task, task_id, payload) for task_id, payload in items]
+        submitted = [(task_id, future) for (task_id, _), future in zip(items, futures)]
         with self._lock:
-            self._futures[task_id] = future
-        future.add_done_callback(lambda _: self._cleanup(task_id))
-        return future
+            self._futures.update(submitted)
+        for task_id, future in submitted:
+            future.add_done_callback(lambda _, task_id=task_id: self._cleanup(task_id))
+        return [future for _, future in submitted]
 
     def _run_task(self, task_id: int, payload: Dict[str, Any]) -> None:
         """执行单个测试任务
@@ -69,16 +87,14 @@ class TaskScheduler:
         try:
             self._task_service.mark_running(task_id)
 
-            # 获取任务记录以获取 display_id（用于文件命名）
-            task_record = self._task_service.get_task(task_id)
-            display_id = task_record.display_id if task_record and task_record.display_id else task_id
+            # 只查询 display_id（用于文件命名），不加载整条任务记录
+            task_view = self._task_service.get_task_view(task_id, "display_id")
+            display_id = (task_view and task_view.display_id) or task_id
 
             # 获取任务类型，默认使用 Python API 方式（向后兼容）
-            task_type_str = payload.get("task_type", "perf_test_api")
-            try:
-                task_type = TaskType(task_type_str)
-            except ValueError:
-                task_type = TaskType.PERF_TEST_API
+            task_type = TASK_TYPES_BY_VALUE.get(
+                payload.get("task_type"), TaskType.PERF_TEST_API
+            )
 
             # 根据任务类型选择执行器
             if task_type == TaskType.PERF_TEST_API:
@@ -94,6 +110,10 @@ class TaskScheduler:
                 # 使用命令行方式
                 result = self._run_command_task(task_id, task_type, payload)
 
+            # 用户取消的命令行任务：状态已由 cancel_task 标记，不再覆盖
+            if (result.get("summary") or {}).get("cancelled"):
+                return
+
             # 处理执行结果
             if result.get("success"):
                 # 检查是否是命令行任务且有 appauto 生成的文件
@@ -117,7 +137,6 @@ class TaskScheduler:
                     )
                 elif task_type != TaskType.PERF_TEST_API and appauto_xlsx:
                     # 使用 appauto 生成的 xlsx 文件
-                    from pathlib import Path
                     original_file = Path.cwd() / appauto_xlsx
                     if original_file.exists():
                         # 重命名文件并移动到 results/ 目录
@@ -189,15 +208,9 @@ class TaskScheduler:
         # 添加 display_id 到 payload
         payload["display_id"] = display_id
 
-        # 在新的事件循环中执行异步任务
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            result = loop.run_until_complete(executor.execute(payload))
-            return result.to_dict()
-        finally:
-            loop.close()
+        # 在当前工作线程的常驻事件循环中执行异步任务
+        result = run_sync(executor.execute(payload))
+        return result.to_dict()
 
     def _run_system_maintenance_task(
         self, task_id: int, payload: Dict[str, Any], display_id: int
@@ -217,15 +230,9 @@ class TaskScheduler:
         # 创建系统维护执行器
         executor = SystemMaintenanceExecutor(task_id=task_id)
 
-        # 在新的事件循环中执行异步任务
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            result = loop.run_until_complete(executor.execute(payload))
-            return result.to_dict()
-        finally:
-            loop.close()
+        # 在当前工作线程的常驻事件循环中执行异步任务
+        result = run_sync(executor.execute(payload))
+        return result.to_dict()
 
     def _run_command_task(
         self, task_id: int, task_type: TaskType, payload: Dict[str, Any]
@@ -264,15 +271,15 @@ class TaskScheduler:
             timeout=payload.get("timeout", 3600),
         )
 
-        # 在新的事件循环中执行异步任务
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
+        # 在当前工作线程的常驻事件循环中执行异步任务
+        with self._lock:
+            self._running[task_id] = executor
         try:
-            result = loop.run_until_complete(executor.execute(payload))
+            result = run_sync(executor.execute(payload))
             return result.to_dict()
         finally:
-            loop.close()
+            with self._lock:
+                self._running.pop(task_id, None)
 
     def _cleanup(self, task_id: int) -> None:
         with self._lock:
@@ -294,8 +301,13 @@ class TaskScheduler:
         with self._lock:
             future = self._futures.get(task_id)
             if future and not future.done():
-                # 尝试取消 Future
+                # 尝试取消 Future；已开始执行的命令行任务则终止其子进程
                 cancelled = future.cancel()
+                if not cancelled:
+                    executor = self._running.get(task_id)
+                    if executor is not None:
+                        executor.cancel()
+                        cancelled = True
                 if cancelled:
                     # 标记任务为已取消状态
                     self._task_service.mark_cancelled(task_id)
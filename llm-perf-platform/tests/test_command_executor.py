@@ -0,0 +1,250 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.executor import base_executor
+from llm_perf_platform.executor.base_executor import TaskType
+from llm_perf_platform.executor import command_executor
+from llm_perf_platform.executor import logger as logger_module
+from llm_perf_platform.executor.command_executor import CANCELLED_ERROR, CommandExecutor
+from llm_perf_platform.tasks.scheduler import TaskScheduler
+
+
+TASK_ID = 424242
+SCHEDULED_TASK_ID = 424243
+
+# 模拟 appauto：后台派生一个长时间运行的进程（如 evalscope），记下其 PID 后等待它结束
+SPAWNING_SCRIPT = 'sleep 30 & echo $! > "$1"; wait'
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    """不查库的执行器：预先放入 TaskLogger 缓存，日志写到临时目录"""
+    monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path)
+    task_logger = logger_module.TaskLogger("test-task", TASK_ID)
+    base_executor._LOGGER_CACHE[TASK_ID] = task_logger
+    executor = CommandExecutor(TASK_ID, appauto_path="/bin/true", timeout=30)
+    yield executor
+    task_logger.close()
+
+
+def _wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _read_pid(path: Path) -> int:
+    assert _wait_until(lambda: path.exists() and path.read_text().strip())
+    return int(path.read_text())
+
+
+def _is_gone(pid: int) -> bool:
+    """进程已退出（不存在或只剩僵尸进程）"""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return True
+    return stat.rsplit(")", 1)[1].split()[0] == "Z"
+
+
+def _cancel_when_started(executor: CommandExecutor, started: list, ready=lambda: True) -> threading.Thread:
+    """子进程登记（且 ready() 为真）后在另一个线程中调用 cancel()，并记下被取消的进程"""
+
+    def run() -> None:
+        _wait_until(lambda: executor._processes and ready())
+        started.extend(executor._processes)
+        executor.cancel()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("has_pidfd", [True, False])
+def test_cancel_kills_and_reaps_running_command(executor, monkeypatch, has_pidfd):
+    if has_pidfd and not command_executor._HAS_PIDFD:
+        pytest.skip("pidfd is not available on this platform")
+    monkeypatch.setattr(command_executor, "_HAS_PIDFD", has_pidfd)
+
+    started = []
+    thread = _cancel_when_started(executor, started)
+    begin = time.monotonic()
+    result = asyncio.run(executor._run_command(["sleep", "30"]))
+    thread.join()
+
+    assert time.monotonic() - begin < 10
+    assert len(started) == 1
+    process = started[0]
+    assert process.returncode is not None  # 已被回收
+    assert process.returncode < 0
+    assert not result.success
+    assert result.error == CANCELLED_ERROR
+    assert result.summary["cancelled"] is True
+    assert executor._processes == {}
+
+
+@pytest.mark.parametrize("has_pidfd", [True, False])
+def test_cancel_kills_descendant_processes(executor, monkeypatch, tmp_path, has_pidfd):
+    if has_pidfd and not command_executor._HAS_PIDFD:
+        pytest.skip("pidfd is not available on this platform")
+    monkeypatch.setattr(command_executor, "_HAS_PIDFD", has_pidfd)
+    pid_file = tmp_path / "child.pid"
+
+    started = []
+    thread = _cancel_when_started(executor, started, ready=lambda: pid_file.exists())
+    result = asyncio.run(executor._run_command(["sh", "-c", SPAWNING_SCRIPT, "sh", str(pid_file)]))
+    thread.join()
+
+    assert result.summary["cancelled"] is True
+    # 整个进程组都被结束，派生的进程不会在任务取消后继续运行
+    assert _wait_until(lambda: _is_gone(_read_pid(pid_file)))
+
+
+@pytest.mark.parametrize("has_pidfd", [True, False])
+def test_cancel_after_process_exited(executor, monkeypatch, has_pidfd):
+    if has_pidfd and not command_executor._HAS_PIDFD:
+        pytest.skip("pidfd is not available on this platform")
+    monkeypatch.setattr(command_executor, "_HAS_PIDFD", has_pidfd)
+
+    async def run():
+        # cat 在 stdin 关闭前不会退出，保证登记（pidfd_open）时子进程仍在运行
+        process = await asyncio.create_subprocess_exec("cat", stdin=asyncio.subprocess.PIPE)
+        pidfd, stopped = executor._track(process)
+        assert (pidfd is not None) == has_pidfd
+        process.stdin.close()
+        await process.wait()
+        # 子进程已退出并被回收，取消时不应抛出异常，只通知等待方
+        executor.cancel()
+        await asyncio.wait_for(stopped, timeout=5)
+        executor._untrack(process, pidfd)
+
+    asyncio.run(run())
+    assert executor._processes == {}
+
+    # 取消之后不再启动新的子进程
+    result = asyncio.run(executor._run_command(["sleep", "30"]))
+    assert result.summary == {"error": CANCELLED_ERROR, "cancelled": True}
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    monkeypatch.setattr(command_executor, "OUTPUT_HEAD_LINES", 2)
+    monkeypatch.setattr(command_executor, "OUTPUT_TAIL_LINES", 3)
+    monkeypatch.setattr(command_executor, "OUTPUT_HEAD_BYTES", 10)
+    monkeypatch.setattr(command_executor, "OUTPUT_TAIL_BYTES", 12)
+
+
+def _fill(lines):
+    buffer = command_executor.OutputBuffer()
+    for line in lines:
+        buffer.append(line)
+    return buffer
+
+
+def test_output_buffer_keeps_everything_under_limits(small_limits):
+    lines = [b"a\n", b"b\n", b"c\n"]
+    buffer = _fill(lines)
+    assert buffer.dropped == 0
+    assert buffer.getvalue() == b"".join(lines)
+
+
+def test_output_buffer_truncates_by_line_count(small_limits):
+    lines = [b"%d\n" % i for i in range(10)]
+    buffer = _fill(lines)
+
+    assert buffer.head == lines[:2]
+    assert list(buffer.tail) == lines[-3:]
+    assert buffer.total == 10
+    assert buffer.dropped == 5
+    assert buffer.getvalue() == b"0\n1\n\n...[truncated 5 lines]...\n7\n8\n9\n"
+
+
+def test_output_buffer_truncates_by_byte_count(small_limits):
+    lines = [b"aaaa\n", b"bbbb\n", b"cccc\n", b"dddd\n", b"eeee\n"]
+    buffer = _fill(lines)
+
+    # 开头最多 10 字节：两行正好 10 字节；末尾最多 12 字节：只能保留两行
+    assert buffer.head == lines[:2]
+    assert list(buffer.tail) == lines[-2:]
+    assert buffer.dropped == 1
+    assert b"...[truncated 1 lines]..." in buffer.getvalue()
+
+
+def test_output_buffer_keeps_single_line_longer_than_byte_cap(small_limits):
+    long_line = b"x" * 100 + b"\n"
+    buffer = _fill([long_line])
+    # 超过开头字节上限的行进入末尾部分，末尾至少保留最后一行
+    assert buffer.head == []
+    assert list(buffer.tail) == [long_line]
+    assert buffer.getvalue() == long_line
+
+    buffer = _fill([b"a\n", b"b\n", b"c\n", long_line])
+    assert buffer.head == [b"a\n", b"b\n"]
+    assert list(buffer.tail) == [long_line]
+    assert buffer.dropped == 1
+    assert buffer.getvalue() == b"a\nb\n\n...[truncated 1 lines]...\n" + long_line
+
+
+class _RecordingTaskService:
+    """只记录状态变更的任务服务"""
+
+    def __init__(self):
+        self.calls = []
+
+    def mark_running(self, task_id):
+        self.calls.append(("running", task_id))
+
+    def get_task_view(self, task_id, *fields):
+        return None
+
+    def mark_completed(self, task_id, result_path, summary):
+        self.calls.append(("completed", task_id))
+
+    def mark_failed(self, task_id, error_message):
+        self.calls.append(("failed", task_id))
+
+    def mark_cancelled(self, task_id):
+        self.calls.append(("cancelled", task_id))
+
+
+def test_scheduler_cancel_task_stops_running_command(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path)
+    task_logger = logger_module.TaskLogger("scheduled-task", SCHEDULED_TASK_ID)
+    base_executor._LOGGER_CACHE[SCHEDULED_TASK_ID] = task_logger
+    appauto = tmp_path / "appauto"
+    appauto.write_text(f"#!/bin/sh\n{SPAWNING_SCRIPT}\n")
+    appauto.chmod(0o755)
+    pid_file = tmp_path / "child.pid"
+
+    scheduler = TaskScheduler(max_workers=1)
+    service = _RecordingTaskService()
+    scheduler._task_service = service
+    try:
+        future = scheduler.submit(SCHEDULED_TASK_ID, {
+            "task_type": TaskType.GENERIC_COMMAND.value,
+            "appauto_path": str(appauto),
+            "command": [str(pid_file)],
+        })
+        child_pid = _read_pid(pid_file)
+
+        assert scheduler.cancel_task(SCHEDULED_TASK_ID) is True
+        future.result(timeout=10)
+        assert _wait_until(lambda: _is_gone(child_pid))
+        # 状态由 cancel_task 标记为已取消，执行结果不再覆盖
+        assert service.calls == [("running", SCHEDULED_TASK_ID), ("cancelled", SCHEDULED_TASK_ID)]
+        assert scheduler.cancel_task(SCHEDULED_TASK_ID) is False
+    finally:
+        scheduler.shutdown()
+        task_logger.close()
@@ -0,0 +1,368 @@
+import asyncio
+import json
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.executor import base_executor
+from llm_perf_platform.executor import hardware_info_executor as hw
+from llm_perf_platform.executor import logger as logger_module
+from llm_perf_platform.executor.hardware_info_executor import HardwareInfoExecutor
+
+
+TASK_ID = 434343
+
+# 各探测命令在真实主机上采集到的输出样例
+NVIDIA_SMI = """\
+0, NVIDIA A100-SXM4-80GB, 535.54.03, 81920, 81000, 920, 34, 0
+1, NVIDIA H100 80GB HBM3, 535.54.03, 81559, 80000, 1559, N/A, N/A
+"""
+
+LSCPU = """\
+Architecture:            x86_64
+  CPU op-mode(s):        32-bit, 64-bit
+  Byte Order:            Little Endian
+CPU(s):                  128
+  On-line CPU(s) list:   0-127
+Vendor ID:               GenuineIntel
+  Model name:            Intel(R) Xeon(R) Platinum 8358 CPU @ 2.60GHz
+    CPU family:          6
+    Thread(s) per core:  2
+"""
+
+FREE = """\
+               total        used        free      shared  buff/cache   available
+Mem:          515581       20480      400000        1024       95101      490000
+Swap:           8191           0        8191
+"""
+
+DMIDECODE = """\
+# dmidecode 3.3
+Getting SMBIOS data from sysfs.
+SMBIOS 3.2.0 present.
+
+Handle 0x0040, DMI type 17, 92 bytes
+Memory Device
+\tArray Handle: 0x003F
+\tTotal Width: 72 bits
+\tSize: 32 GB
+\tForm Factor: DIMM
+\tLocator: DIMM_A1
+\tType: DDR4
+\tSpeed: 3200 MT/s
+\tManufacturer: Samsung
+\tPart Number: M393A4K40DB3-CWE
+\tConfigured Memory Speed: 2933 MT/s
+
+Handle 0x0041, DMI type 17, 92 bytes
+Memory Device
+\tSize: No Module Installed
+\tLocator: DIMM_A2
+
+Handle 0x0042, DMI type 17, 92 bytes
+Memory Device
+\tSize: 16384 MB
+\tForm Factor: DIMM
+\tLocator: DIMM_B1
+\tType: DDR4
+\tSpeed: 3200 MT/s
+"""
+
+DF = """\
+Filesystem      Size  Used Avail Use% Mounted on
+udev            252G     0  252G   0% /dev
+/dev/nvme0n1p2  1.8T  1.2T  500G  71% /
+tmpfs            51G  2.0M   51G   1% /run
+/dev/nvme1n1    3.5T  2.0T  1.5T  58% /mnt/data
+"""
+
+OS_RELEASE = """\
+NAME="Ubuntu"
+VERSION="22.04.3 LTS (Jammy Jellyfish)"
+ID=ubuntu
+PRETTY_NAME="Ubuntu 22.04.3 LTS"
+"""
+
+SAMPLES = {
+    "gpu": NVIDIA_SMI,
+    "cpu": LSCPU,
+    "memory": FREE,
+    "dimm": DMIDECODE,
+    "disk": DF,
+    "os_name": OS_RELEASE,
+    "kernel": "5.15.0-91-generic\n",
+    "hostname": "gpu-node-01\n",
+    "primary_ip": "10.0.0.12 172.17.0.1 fe80::1\n",
+    "machine_id": "4f3c2b1a0e9d8c7b6a5f4e3d2c1b0a99\n",
+}
+MACHINE_ID = SAMPLES["machine_id"].strip()
+
+
+class LocalShell:
+    """在本机 bash 中执行合并脚本，代替 SSH 连接"""
+
+    host = "10.0.0.12"
+    port = 22
+
+    def __init__(self):
+        self.scripts = []
+
+    async def execute(self, cmd, timeout=None):
+        self.scripts.append(cmd)
+        proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+        return proc.stdout.strip(), proc.stderr.strip(), proc.returncode
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path / "logs")
+    task_logger = logger_module.TaskLogger("hw-task", TASK_ID)
+    base_executor._LOGGER_CACHE[TASK_ID] = task_logger
+    # 缓存相关的类属性和文件都换成本用例独立的
+    monkeypatch.setattr(HardwareInfoExecutor, "_STATIC_CACHE", None)
+    monkeypatch.setattr(HardwareInfoExecutor, "_NO_GPU_HOSTS", {})
+    monkeypatch.setattr(hw, "_STATIC_CACHE_FILE", tmp_path / ".hw_cache.json")
+    hw._build_script.cache_clear()
+    yield HardwareInfoExecutor(TASK_ID)
+    hw._build_script.cache_clear()
+    task_logger.close()
+
+
+@pytest.fixture
+def probes(tmp_path, monkeypatch):
+    """把每个探测命令替换为输出样例文件；返回的字典可再覆盖单个探测的命令"""
+    commands = {}
+    for name, output in SAMPLES.items():
+        path = tmp_path / f"{name}.txt"
+        path.write_text(output)
+        commands[name] = f"cat {shlex.quote(str(path))}"
+    monkeypatch.setattr(hw, "_HW_PROBES", commands)
+    return commands
+
+
+def test_split_sections_reads_output_and_exit_code_per_probe(monkeypatch):
+    monkeypatch.setattr(hw, "_HW_PROBES", {
+        "multi": "printf 'line 1\\nline 2\\n'",
+        "failing": "echo partial; echo oops >&2; exit 3",
+        "silent": "true",
+        "missing": "true",
+    })
+    hw._build_script.cache_clear()
+    try:
+        script = hw._build_script(("multi", "failing", "silent"))
+    finally:
+        hw._build_script.cache_clear()
+    stdout = subprocess.run(["bash", "-c", script], capture_output=True, text=True).stdout
+
+    assert hw._split_sections(stdout) == {
+        "multi": ("line 1\nline 2", 0),
+        "failing": ("partial", 3),
+        "silent": ("", 0),
+        # 未执行（或脚本中途中断）的探测按失败处理
+        "missing": ("", 1),
+    }
+
+
+def test_collect_parses_sample_output_of_every_probe(executor, probes):
+    info = asyncio.run(executor._collect_hardware_info(LocalShell()))
+
+    assert info["gpus"] == [
+        {
+            "index": 0,
+            "name": "NVIDIA A100-SXM4-80GB",
+            "driver_version": "535.54.03",
+            "memory_total_mb": 81920,
+            "memory_free_mb": 81000,
+            "memory_used_mb": 920,
+            "temperature_c": 34,
+            "utilization_percent": 0,
+        },
+        {
+            "index": 1,
+            "name": "NVIDIA H100 80GB HBM3",
+            "driver_version": "535.54.03",
+            "memory_total_mb": 81559,
+            "memory_free_mb": 80000,
+            "memory_used_mb": 1559,
+            "temperature_c": None,
+            "utilization_percent": None,
+        },
+    ]
+    assert info["cpu_cores"] == 128
+    assert info["cpu_model"] == "Intel(R) Xeon(R) Platinum 8358 CPU @ 2.60GHz"
+    assert info["cpu_arch"] == "x86_64"
+
+    assert info["memory_total_gb"] == round(515581 / 1024, 2)
+    assert info["memory_used_gb"] == round(20480 / 1024, 2)
+    assert info["memory_free_gb"] == round(400000 / 1024, 2)
+    assert info["memory_available_gb"] == round(490000 / 1024, 2)
+    assert [device["locator"] for device in info["memory_devices"]] == ["DIMM_A1", "DIMM_B1"]
+    assert info["memory_devices"][0] == {
+        "size": "32 GB",
+        "form_factor": "DIMM",
+        "locator": "DIMM_A1",
+        "type": "DDR4",
+        "speed": "3200 MT/s",
+        "manufacturer": "Samsung",
+        "part_number": "M393A4K40DB3-CWE",
+        "configured_speed": "2933 MT/s",
+    }
+    assert info["memory_module_count"] == 2
+    assert info["memory_hardware_total_gb"] == 48
+    assert info["memory_type"] == "DDR4"
+    assert info["memory_configured_speed"] == "2933 MT/s"
+
+    assert info["disks"] == [
+        {"device": "/dev/nvme0n1p2", "size": "1.8T", "used": "1.2T", "available": "500G",
+         "use_percent": "71%", "mount_point": "/"},
+        {"device": "/dev/nvme1n1", "size": "3.5T", "used": "2.0T", "available": "1.5T",
+         "use_percent": "58%", "mount_point": "/mnt/data"},
+    ]
+    assert info["os"] == {
+        "name": "Ubuntu 22.04.3 LTS",
+        "kernel_version": "5.15.0-91-generic",
+        "hostname": "gpu-node-01",
+    }
+    assert info["network"] == {"primary_ip": "10.0.0.12"}
+
+
+def test_host_without_gpu_and_failing_probes(executor, probes, tmp_path):
+    # nvidia-smi 不存在时探测命令输出固定提示；dmidecode 没有权限时非零退出且无输出；
+    # hostname -I 不支持时失败；内核版本输出为空
+    probes["gpu"] = "echo 'No NVIDIA GPU'"
+    probes["dimm"] = "echo 'Permission denied' >&2; exit 1"
+    probes["primary_ip"] = "exit 255"
+    probes["kernel"] = "true"
+    shell = LocalShell()
+
+    info = asyncio.run(executor._collect_hardware_info(shell))
+
+    assert info["gpus"] == []
+    assert "memory_devices" not in info
+    assert info["memory_total_gb"] == round(515581 / 1024, 2)
+    assert info["os"]["kernel_version"] == "Unknown"
+    assert info["network"] == {"primary_ip": "Unknown"}
+
+    # 失败的静态探测不缓存；缓存按机器标识保存；没有 GPU 的主机下次跳过 GPU 探测
+    stored = json.loads(hw._STATIC_CACHE_FILE.read_text())
+    assert stored["hosts"] == {f"{shell.host}:{shell.port}": MACHINE_ID}
+    assert set(stored["machines"][MACHINE_ID]) == {"cpu", "os_name", "kernel", "hostname"}
+
+    assert info["metadata"]["gpu_probe_skipped"] is False
+
+    info = asyncio.run(executor._collect_hardware_info(shell))
+    second_script = shell.scripts[-1]
+    assert probes["gpu"] not in second_script
+    assert probes["cpu"] not in second_script
+    assert probes["dimm"] in second_script
+    assert info["gpus"] == []
+    assert info["metadata"]["gpu_probe_skipped"] is True
+    assert info["cpu_cores"] == 128
+
+    # 驱动修复后用户强制刷新：重新探测 GPU，之后不再跳过
+    probes["gpu"] = f"cat {shlex.quote(str(tmp_path / 'gpu.txt'))}"
+    hw._build_script.cache_clear()
+    info = asyncio.run(executor._collect_hardware_info(shell, force_refresh=True))
+    assert len(info["gpus"]) == 2
+    assert info["metadata"]["gpu_probe_skipped"] is False
+    assert HardwareInfoExecutor._NO_GPU_HOSTS == {}
+
+
+def test_dimm_devices_from_jc_json_match_text_parser():
+    devices = [
+        {
+            "handle": "0x0040",
+            "type": 17,
+            "description": "Memory Device",
+            "values": {
+                "size": "32 GB",
+                "form_factor": "DIMM",
+                "locator": "DIMM_A1",
+                "type": "DDR4",
+                "speed": "3200 MT/s",
+                "manufacturer": "Samsung",
+                "part_number": "M393A4K40DB3-CWE",
+                "configured_memory_speed": "2933 MT/s",
+                "total_width": "72 bits",
+            },
+        },
+        {"handle": "0x003F", "type": 16, "description": "Physical Memory Array", "values": {}},
+    ]
+    from_json = HardwareInfoExecutor._parse_dimm_devices(json.dumps(devices))
+    from_text = HardwareInfoExecutor._parse_dimm_devices(DMIDECODE)
+    assert from_json == from_text[:1]
+
+
+def test_disks_parsed_when_df_exits_non_zero(executor, probes):
+    # 某个挂载点不可读（如失效的 NFS）时 df 仍输出其余行，但以 1 退出
+    probes["disk"] = f"{probes['disk']}; echo \"df: /mnt/nfs: Stale file handle\" >&2; exit 1"
+
+    info = asyncio.run(executor._collect_hardware_info(LocalShell()))
+
+    assert [disk["mount_point"] for disk in info["disks"]] == ["/", "/mnt/data"]
+
+
+def test_cached_fields_are_marked_and_force_refresh_bypasses_cache(executor, probes):
+    shell = LocalShell()
+    first = asyncio.run(executor._collect_hardware_info(shell))
+    assert first["metadata"] == {"cached_fields": {}, "gpu_probe_skipped": False}
+
+    second = asyncio.run(executor._collect_hardware_info(shell))
+    assert probes["cpu"] not in shell.scripts[-1]
+    cached_fields = second["metadata"]["cached_fields"]
+    assert set(cached_fields) == {
+        "cpu_cores", "cpu_model", "cpu_arch",
+        "memory_devices", "memory_module_count", "memory_hardware_total_gb",
+        "memory_type", "memory_speed", "memory_configured_speed",
+        "os.name", "os.kernel_version", "os.hostname",
+    }
+    # 标记的是缓存值实际采集的时间
+    assert len(set(cached_fields.values())) == 1
+    assert {key: value for key, value in second.items() if key != "metadata"} == {
+        key: value for key, value in first.items() if key != "metadata"
+    }
+
+    refreshed = asyncio.run(executor._collect_hardware_info(shell, force_refresh=True))
+    assert all(probes[name] in shell.scripts[-1] for name in hw._STATIC_PROBES)
+    assert refreshed["metadata"] == {"cached_fields": {}, "gpu_probe_skipped": False}
+
+
+def test_static_cache_not_reused_when_address_moves_to_another_machine(executor, probes, tmp_path):
+    shell = LocalShell()
+    asyncio.run(executor._collect_hardware_info(shell))
+
+    # 同一 IP 分配给了另一台机器
+    (tmp_path / "machine_id.txt").write_text("0123456789abcdef0123456789abcdef\n")
+    (tmp_path / "cpu.txt").write_text(LSCPU.replace("128", "64"))
+    info = asyncio.run(executor._collect_hardware_info(shell))
+
+    # 第一次执行跳过了静态探测，发现机器已变化后补采
+    assert len(shell.scripts) == 3
+    assert probes["cpu"] in shell.scripts[-1]
+    assert info["cpu_cores"] == 64
+    assert info["metadata"] == {"cached_fields": {}, "gpu_probe_skipped": False}
+
+    stored = json.loads(hw._STATIC_CACHE_FILE.read_text())
+    assert stored["hosts"] == {f"{shell.host}:{shell.port}": "0123456789abcdef0123456789abcdef"}
+    assert set(stored["machines"]) == {MACHINE_ID, "0123456789abcdef0123456789abcdef"}
+
+
+def test_probes_run_in_c_locale(monkeypatch):
+    # lscpu、free 的字段名会按语言环境翻译（如 "Architektur:"、"Speicher:"），解析依赖英文字段名
+    monkeypatch.setenv("LC_ALL", "de_DE.UTF-8")
+    monkeypatch.setattr(hw, "_HW_PROBES", {"locale": 'echo "$LC_ALL"'})
+    hw._build_script.cache_clear()
+    try:
+        script = hw._build_script(("locale",))
+    finally:
+        hw._build_script.cache_clear()
+    stdout = subprocess.run(["bash", "-c", script], capture_output=True, text=True).stdout
+
+    assert hw._split_sections(stdout)["locale"] == ("C", 0)
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.executor.model_scanner import ModelScanner
+
+
+GIB = 1024 ** 3
+
+
+class LocalShell:
+    """在本机 bash 中执行命令，代替 SSH 连接"""
+
+    def __init__(self):
+        self.commands = []
+
+    async def execute(self, cmd, timeout=None):
+        self.commands.append(cmd)
+        proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+        return proc.stdout.strip(), proc.stderr.strip(), proc.returncode
+
+
+def _sparse_file(path: Path, size: int) -> Path:
+    """按表观大小占位的稀疏文件，du -b 统计表观大小，不实际占用磁盘"""
+    with open(path, "wb") as f:
+        f.truncate(size)
+    return path
+
+
+def test_directory_sizes_match_per_directory_du(tmp_path):
+    qwen = tmp_path / "Qwen3-8B"
+    qwen.mkdir()
+    weights = _sparse_file(qwen / "model.safetensors", 2 * GIB)
+    # 同一目录内的硬链接只计一次
+    os.link(weights, qwen / "model-link.safetensors")
+
+    # 与其他目录共享硬链接的文件也计入本目录
+    llama = tmp_path / "Llama 3 70B"
+    llama.mkdir()
+    os.link(weights, llama / "shared.safetensors")
+    _sparse_file(llama / "extra.safetensors", GIB)
+
+    scanner = ModelScanner({"host": "10.0.0.1", "user": "root"})
+    scanner.ssh_client = LocalShell()
+    sizes = asyncio.run(scanner._get_directory_sizes_gb(
+        str(tmp_path), ["Qwen3-8B", "Llama 3 70B", "missing"]
+    ))
+
+    # 一次远程调用取回全部目录，结果与逐个目录执行 du -sb 一致；不存在的目录不在结果中
+    assert len(scanner.ssh_client.commands) == 1
+    assert sizes == {"Qwen3-8B": 2.0, "Llama 3 70B": 3.0}
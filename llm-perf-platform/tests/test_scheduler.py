@@ -0,0 +1,32 @@
+import sys
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.tasks.scheduler import TaskScheduler
+
+
+def test_tasks_run_in_submission_order(monkeypatch):
+    order = []
+    gate = threading.Event()
+
+    def run_task(task_id, payload):
+        gate.wait(timeout=5)
+        order.append(task_id)
+
+    scheduler = TaskScheduler(max_workers=1)
+    monkeypatch.setattr(scheduler, "_run_task", run_task)
+    try:
+        # 第一个任务阻塞唯一的工作线程，其余任务都在队列中等待
+        futures = [scheduler.submit(task_id, {}) for task_id in range(10)]
+        futures += scheduler.submit_many((task_id, {}) for task_id in range(10, 20))
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+    assert order == list(range(20))
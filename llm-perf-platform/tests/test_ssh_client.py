@@ -0,0 +1,129 @@
+import asyncio
+import socket
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from weakref import WeakSet
+
+import asyncssh
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.executor import ssh_client
+from llm_perf_platform.executor.ssh_client import SSHClient
+
+
+SSH_CONFIG = {"host": "10.0.0.1", "user": "root", "auth_type": "password", "password": "secret"}
+
+
+class FakeSocket:
+    def __init__(self):
+        self.shutdown_calls = []
+
+    def shutdown(self, how):
+        self.shutdown_calls.append(how)
+
+
+class FakeConnection:
+    """只实现 SSHClient 用到的接口；dropped 为真时模拟已被服务端或 NAT 断开的连接"""
+
+    def __init__(self):
+        self.dropped = False
+        self.closed = False
+        self.commands = []
+        self.socket = FakeSocket()
+
+    async def run(self, command, check=False):
+        if self.dropped:
+            raise asyncssh.ConnectionLost("Connection lost")
+        self.commands.append(command)
+        return SimpleNamespace(stdout="ok\n", stderr="", exit_status=0)
+
+    def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+    async def wait_closed(self):
+        pass
+
+    def get_extra_info(self, name, default=None):
+        return self.socket if name == "socket" else default
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """替换 asyncssh.connect，返回依次建立的连接列表；连接池状态每个用例独立"""
+    opened = []
+
+    async def connect(**kwargs):
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(ssh_client.asyncssh, "connect", connect)
+    monkeypatch.setattr(ssh_client, "_pool", {})
+    monkeypatch.setattr(ssh_client, "_pool_loops", WeakSet())
+    return opened
+
+
+async def _run_once(command="hostname"):
+    async with SSHClient(SSH_CONFIG) as ssh:
+        return await ssh.execute(command)
+
+
+def test_loop_without_pool_closes_released_connection(connections):
+    # 调度线程的事件循环（run_sync）未启用连接池：归还即关闭
+    assert asyncio.run(_run_once()) == ("ok", "", 0)
+
+    assert len(connections) == 1
+    assert connections[0].closed
+    assert ssh_client._pool == {}
+
+
+def test_pooled_connection_is_reused_and_retried_when_dropped(connections):
+    async def main():
+        ssh_client.enable_connection_pool()
+        await _run_once()
+        assert not connections[0].closed
+
+        # 空闲期间连接被断开：复用时失败，换新连接重试一次
+        connections[0].dropped = True
+        assert await _run_once("uname -r") == ("ok", "", 0)
+        assert connections[0].closed
+        assert connections[1].commands == ["uname -r"]
+
+        await _run_once()
+        assert len(connections) == 2
+
+        # 新建的连接（其他用户，池中没有空闲连接）失败时不重试
+        with pytest.raises(asyncssh.ConnectionLost):
+            async with SSHClient({**SSH_CONFIG, "user": "admin"}) as ssh:
+                ssh.conn.dropped = True
+                await ssh.execute("hostname")
+        assert len(connections) == 3
+
+        await ssh_client.close_connection_pool()
+
+    asyncio.run(main())
+    assert all(conn.closed for conn in connections)
+    assert ssh_client._pool == {}
+
+
+def test_connections_of_closed_loop_are_shut_down(connections):
+    async def pooled_run():
+        ssh_client.enable_connection_pool()
+        await _run_once()
+
+    asyncio.run(pooled_run())
+    orphaned = connections[0]
+    assert not orphaned.closed
+
+    # 其他循环访问连接池时清理已关闭循环的条目，并关闭其套接字
+    asyncio.run(pooled_run())
+    assert orphaned.socket.shutdown_calls == [socket.SHUT_RDWR]
+    assert len(ssh_client._pool) == 1
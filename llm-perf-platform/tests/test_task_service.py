@@ -0,0 +1,210 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlmodel import Session, create_engine
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_perf_platform.api import tests as tests_api
+from llm_perf_platform.services import task_service as task_service_module
+from llm_perf_platform.services.task_service import TaskService, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def task_engine(tmp_path, monkeypatch):
+    """每个用例使用独立的 SQLite 数据库，只建任务表"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    task_service_module.TaskRecord.__table__.create(engine)
+    monkeypatch.setattr(
+        task_service_module, "get_session", lambda: Session(engine, expire_on_commit=False)
+    )
+    task_service_module._invalidate_count_cache()
+    yield engine
+    task_service_module._invalidate_count_cache()
+    engine.dispose()
+
+
+@pytest.fixture
+async def api_client(task_engine):
+    app = FastAPI()
+    app.include_router(tests_api.router, prefix="/api")
+    app.dependency_overrides[tests_api.get_current_user] = lambda: type("User", (), {"id": None})()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://perftesterver",
+    ) as client:
+        yield client
+
+
+def _create(service: TaskService, count: int, **spec):
+    return service.create_tasks(
+        [{"engine": "vllm", "model": f"m{i}", "parameters": {}, **spec} for i in range(count)]
+    )
+
+
+def test_cursor_pages_cover_all_tasks_newest_first(task_engine):
+    service = TaskService()
+    base = datetime(2024, 1, 1)
+    records = service.create_tasks([
+        {"engine": "vllm", "model": f"m{i}", "parameters": {}, "created_at": base + timedelta(minutes=i)}
+        for i in range(7)
+    ])
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = service.list_tasks_by_cursor(cursor=cursor, page_size=3)
+        assert len(page) <= 3
+        seen.extend(task.id for task in page)
+        if cursor is None:
+            break
+
+    assert seen == [record.id for record in reversed(records)]
+
+
+def test_cursor_breaks_created_at_ties_by_id(task_engine):
+    service = TaskService()
+    same_time = datetime(2024, 1, 1, 12, 0, 0)
+    records = _create(service, 5, created_at=same_time)
+
+    first, cursor = service.list_tasks_by_cursor(page_size=2)
+    second, cursor = service.list_tasks_by_cursor(cursor=cursor, page_size=2)
+    third, cursor = service.list_tasks_by_cursor(cursor=cursor, page_size=2)
+
+    ids = [task.id for task in first + second + third]
+    assert ids == sorted((record.id for record in records), reverse=True)
+    assert cursor is None
+    assert decode_cursor(encode_cursor(first[-1])) == (same_time, first[-1].id)
+
+
+def test_decode_cursor_rejects_malformed_input():
+    # 非 base64、缺少分隔符（"no-separator"）、ID 不是整数（"2024-01-01T00:00:00|x"）
+    for cursor in ("not-base64!", "bm8tc2VwYXJhdG9y", "MjAyNC0wMS0wMVQwMDowMDowMHx4"):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+@pytest.mark.anyio
+async def test_list_with_malformed_cursor_returns_400(api_client):
+    resp = await api_client.get("/api/tests/list", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+    resp = await api_client.get("/api/tests/list", params={"cursor": ""})
+    assert resp.status_code == 200
+    assert resp.json()["has_more"] is False
+
+
+def test_count_cache_invalidated_on_create_and_delete(task_engine):
+    service = TaskService()
+    assert service.count_tasks() == 0
+
+    # 绕过 TaskService 直接写库：缓存未失效，仍返回旧值
+    with Session(task_engine) as session:
+        session.add(task_service_module.TaskRecord(engine="vllm", model="raw", parameters={}))
+        session.commit()
+    assert service.count_tasks() == 0
+
+    record = service.create_task(engine="vllm", model="m", parameters={})
+    assert service.count_tasks() == 2
+    assert service.count_tasks(task_type="hardware_info") == 0
+
+    service.delete_task(record.id)
+    assert service.count_tasks() == 1
+
+
+def test_create_tasks_assigns_display_ids_in_input_order(task_engine):
+    service = TaskService()
+    _create(service, 2)
+    records = _create(service, 4, task_type="hardware_info")
+
+    assert [record.model for record in records] == ["m0", "m1", "m2", "m3"]
+    assert [record.id for record in records] == [3, 4, 5, 6]
+    for record in records:
+        stored = service.get_task(record.id)
+        assert stored.display_id == record.display_id == record.id
+        assert stored.model == record.model
+        assert stored.task_type == "hardware_info"
+    assert service.create_tasks([]) == []
+
+
+class _RecordingScheduler:
+    def __init__(self):
+        self.submit_many_calls = []
+
+    def submit(self, task_id, payload):
+        raise AssertionError("batch endpoint should submit through submit_many")
+
+    def submit_many(self, items):
+        self.submit_many_calls.append(list(items))
+        return []
+
+
+@pytest.mark.anyio
+async def test_batch_perf_endpoint_creates_tasks_and_submits_once(api_client, monkeypatch):
+    scheduler = _RecordingScheduler()
+    monkeypatch.setattr(tests_api, "task_scheduler", scheduler)
+    requests = [
+        {"ip": "10.0.0.1", "model": f"model-{i}", "parallel": f"{i + 1} 8"}
+        for i in range(3)
+    ]
+
+    resp = await api_client.post("/api/tests/run_perf/amaas/skip_launch/batch", json=requests)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["concurrency"] for item in body] == [1, 2, 3]
+    assert all(item["status"] == "queued" for item in body)
+
+    assert len(scheduler.submit_many_calls) == 1
+    submitted = scheduler.submit_many_calls[0]
+    assert [task_id for task_id, _ in submitted] == [item["task_id"] for item in body]
+    for (task_id, payload), request in zip(submitted, requests):
+        assert payload["task_id"] == task_id
+        assert payload["model"] == request["model"]
+        assert payload["base"] == "amaas" and payload["skip_launch"] is True
+
+    service = TaskService()
+    assert service.count_tasks() == 3
+    for item, request in zip(body, requests):
+        record = service.get_task(item["task_id"])
+        assert record.display_id == record.id
+        assert record.model == request["model"]
+        assert record.parameters["concurrency"] == item["concurrency"]
+
+
+@pytest.mark.anyio
+async def test_delete_task_removes_row_before_files(api_client, tmp_path, monkeypatch):
+    service = TaskService()
+    result_file = tmp_path / "result.xlsx"
+    result_file.write_bytes(b"xlsx")
+    record = service.create_task(engine="vllm", model="m", parameters={})
+    service.mark_completed(record.id, result_path=str(result_file), summary={})
+
+    def failing_delete(task_id):
+        raise RuntimeError("database is locked")
+
+    # 数据库删除失败：文件保留，记录仍指向存在的文件
+    with monkeypatch.context() as patch:
+        patch.setattr(tests_api.task_service, "delete_task", failing_delete)
+        with pytest.raises(RuntimeError):
+            await api_client.delete(f"/api/tests/{record.id}")
+    assert result_file.exists()
+    assert service.get_task(record.id) is not None
+
+    resp = await api_client.delete(f"/api/tests/{record.id}")
+    assert resp.status_code == 200
+    assert not result_file.exists()
+    assert service.get_task(record.id) is None